@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class _Node:
+    __slots__ = ("children", "first", "is_command", "order", "unresolved", "visible")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.is_command = False
+        # The order of the command of this node, if visible
+        self.order: tuple[int, int] | None = None
+        # Number of visible commands strictly below this node
+        self.visible = 0
+        # The first order of the visible commands strictly below this node
+        self.first: tuple[int, int] | None = None
+        # The names strictly below this node whose hidden flag is not known yet
+        self.unresolved: dict[str, None] = {}
+
+
+class CommandIndex:
+    """
+    A word level trie over command names and aliases.
+
+    Resolving the command matching the beginning of the input,
+    checking whether a namespace exists and listing namespaces
+    do not depend on the total number of commands.
+
+    Namespaces are listed in the order their first visible command
+    was added, aliases being ordered right after the command they alias.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        # The hidden flag of each indexed name, None while unknown
+        self._hidden: dict[str, bool | None] = {}
+        # The order of each name, kept when the name is indexed again
+        self._orders: dict[str, tuple[int, int]] = {}
+        self._next_order = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._hidden
+
+    def add(
+        self, name: str, hidden: bool | None = False, alias_of: str | None = None
+    ) -> None:
+        if name in self._hidden:
+            if self._hidden[name] == hidden:
+                return
+
+            self.remove(name)
+
+        order = self._orders.get(name)
+        if order is None:
+            if alias_of is not None and alias_of in self._orders:
+                order = (self._orders[alias_of][0], self._next_order)
+            else:
+                order = (self._next_order, 0)
+
+            self._next_order += 1
+            self._orders[name] = order
+
+        node = self._root
+        path = []
+        for word in name.split(" "):
+            path.append(node)
+            node = node.children.setdefault(word, _Node())
+
+        node.is_command = True
+        self._hidden[name] = hidden
+
+        if hidden is None:
+            for parent in path:
+                parent.unresolved[name] = None
+        elif not hidden:
+            node.order = order
+
+            for parent in path[1:]:
+                parent.visible += 1
+                if parent.first is None or order < parent.first:
+                    parent.first = order
+
+    def remove(self, name: str) -> None:
+        if name not in self._hidden:
+            return
+
+        hidden = self._hidden.pop(name)
+
+        node = self._root
+        path = []
+        for word in name.split(" "):
+            path.append((node, word))
+            node = node.children[word]
+
+        node.is_command = False
+        node.order = None
+
+        if hidden is None:
+            for parent, _ in path:
+                del parent.unresolved[name]
+        elif not hidden:
+            for parent, _ in path[1:]:
+                parent.visible -= 1
+
+            for parent, _ in reversed(path[1:]):
+                parent.first = min(
+                    (
+                        order
+                        for child in parent.children.values()
+                        for order in (child.order, child.first)
+                        if order is not None
+                    ),
+                    default=None,
+                )
+
+        for parent, word in reversed(path):
+            child = parent.children[word]
+            if child.children or child.is_command:
+                break
+
+            del parent.children[word]
+
+    def unresolved(self, namespace: str | None = None) -> list[str]:
+        """
+        Returns the names whose hidden flag is not known yet,
+        only those of the given namespace if any.
+        """
+        node = self._root
+        if namespace is not None:
+            for word in namespace.split(" "):
+                child = node.children.get(word)
+                if child is None:
+                    return []
+
+                node = child
+
+        return list(node.unresolved)
+
+    def longest_match(self, tokens: Sequence[str]) -> str | None:
+        """
+        Returns the longest command name made of the first tokens.
+        """
+        node = self._root
+        end = 0
+
+        for i, token in enumerate(tokens):
+            for word in token.split(" "):
+                child = node.children.get(word)
+                if child is None:
+                    return " ".join(tokens[:end]) or None
+
+                node = child
+
+            if node.is_command:
+                end = i + 1
+
+        return " ".join(tokens[:end]) or None
+
+    def has_namespace(self, namespace: str) -> bool:
+        node = self._root
+        for word in namespace.split(" "):
+            child = node.children.get(word)
+            if child is None:
+                return False
+
+            node = child
+
+        return node.visible > 0
+
+    def namespaces(self) -> list[str]:
+        """
+        Returns the namespaces containing at least one visible command.
+        """
+        namespaces = []
+        stack = [(word, 1, node) for word, node in self._root.children.items()]
+
+        while stack:
+            namespace, depth, node = stack.pop()
+            if not node.visible:
+                continue
+
+            assert node.first is not None
+            namespaces.append((node.first, depth, namespace))
+            stack.extend(
+                (f"{namespace} {word}", depth + 1, child)
+                for word, child in node.children.items()
+            )
+
+        return [namespace for _, _, namespace in sorted(namespaces)]
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import math
+import re
 import unicodedata
 
+from collections import Counter
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from functools import lru_cache
 from html.parser import HTMLParser
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 class TagStripper(HTMLParser):
@@ -48,33 +55,93 @@ def strip_tags(value: str) -> str:
     return value
 
 
-def find_similar_names(name: str, names: list[str]) -> list[str]:
+class SimilarNameIndex:
     """
-    Finds names similar to a given command name.
+    An index of names to find the ones similar to a given name.
+
+    The similarity ratio of two strings is bounded by the number of
+    characters they have in common, so the character counts of every
+    name are computed once and used to skip most names before running
+    the costly sequence matching.
     """
-    threshold = 0.4
-    distance_by_name = {}
-    if " " in name:
-        names = [name for name in names if " " in name]
-    for actual_name in names:
-        distance = SequenceMatcher(None, actual_name, name).ratio()
 
-        is_similar = distance <= len(name) / 3
-        substring_index = actual_name.find(name)
-        is_substring = substring_index != -1
+    THRESHOLD = 0.4
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._names: dict[str, Counter[str]] = {}
+
+        for name in names:
+            self.add(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str) -> None:
+        if name not in self._names:
+            self._names[name] = Counter(name)
+
+    def find(self, name: str) -> list[str]:
+        """
+        Finds names similar to a given command name.
+        """
+        threshold = self.THRESHOLD
+        length = len(name)
+        characters = Counter(name).items()
+        namespaced = " " in name
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(name)
+
+        matches = []
+        for position, (actual_name, actual_characters) in enumerate(
+            self._names.items()
+        ):
+            if namespaced and " " not in actual_name:
+                continue
+
+            total_length = length + len(actual_name)
+            if total_length:
+                if 2 * min(length, len(actual_name)) / total_length <= threshold:
+                    continue
+
+                common = sum(
+                    min(count, actual_characters[character])
+                    for character, count in characters
+                )
+                if 2 * common / total_length <= threshold:
+                    continue
+
+            matcher.set_seq1(actual_name)
+            distance = matcher.ratio()
+            if distance <= threshold:
+                continue
+
+            is_similar = distance <= length / 3
+            substring_index = actual_name.find(name)
+            is_substring = substring_index != -1
+
+            if is_similar or is_substring:
+                matches.append(
+                    (
+                        distance,
+                        substring_index if is_substring else float("inf"),
+                        position,
+                        actual_name,
+                    )
+                )
+
+        # Display results with shortest distance first
+        return [match[-1] for match in sorted(matches)]
 
-        if is_similar or is_substring:
-            distance_by_name[actual_name] = (
-                distance,
-                substring_index if is_substring else float("inf"),
-            )
 
-    # Only keep results with a distance below the threshold
-    distance_by_name = {
-        key: value for key, value in distance_by_name.items() if value[0] > threshold
-    }
-    # Display results with shortest distance first
-    return sorted(distance_by_name, key=lambda key: distance_by_name[key])
+def find_similar_names(name: str, names: list[str]) -> list[str]:
+    """
+    Finds names similar to a given command name.
+    """
+    return SimilarNameIndex(names).find(name)
 
 
 @dataclass
@@ -109,13 +176,7 @@ def format_time(secs: float) -> str:
     return time_format.apply(secs)
 
 
-@lru_cache(100)
-def wcwidth(c: str) -> int:
-    """Determine how many columns are needed to display a character in a terminal.
-
-    Returns -1 if the character is not printable.
-    Returns 0, 1 or 2 for other characters.
-    """
+def _wcwidth(c: str) -> int:
     o = ord(c)
 
     # ASCII fast path.
@@ -148,15 +209,144 @@ def wcwidth(c: str) -> int:
     return 1
 
 
+class _Widths(dict[str, int]):
+    """
+    The widths of the characters, computed when first looked up.
+    """
+
+    def __missing__(self, c: str) -> int:
+        width = self[c] = _wcwidth(c)
+
+        return width
+
+
+class _DisplayWidths(dict[str, int]):
+    """
+    The display widths of the characters, computed when first looked up.
+    """
+
+    def __missing__(self, c: str) -> int:
+        width = _WIDTHS[c]
+        if width < 0:
+            width = 1
+
+        self[c] = width
+
+        return width
+
+
+_WIDTHS = _Widths()
+_DISPLAY_WIDTHS = _DisplayWidths()
+
+
+def wcwidth(c: str) -> int:
+    """Determine how many columns are needed to display a character in a terminal.
+
+    Returns -1 if the character is not printable.
+    Returns 0, 1 or 2 for other characters.
+    """
+    return _WIDTHS[c]
+
+
 def wcswidth(s: str) -> int:
     """Determine how many columns are needed to display a string in a terminal.
 
     Returns -1 if the string contains non-printable characters.
     """
-    width = 0
-    for c in unicodedata.normalize("NFC", s):
-        wc = wcwidth(c)
-        if wc < 0:
-            return -1
-        width += wc
-    return width
+    if s.isascii() and s.isprintable():
+        return len(s)
+
+    if not unicodedata.is_normalized("NFC", s):
+        s = unicodedata.normalize("NFC", s)
+
+    widths = list(map(_WIDTHS.__getitem__, s))
+    if widths and min(widths) < 0:
+        return -1
+
+    return sum(widths)
+
+
+def display_width(s: str) -> int:
+    """
+    Determines how many columns are needed to display a string,
+    non-printable characters taking one column.
+    """
+    if s.isascii():
+        return len(s)
+
+    return sum(map(_DISPLAY_WIDTHS.__getitem__, s))
+
+
+def width_index(s: str, width: int) -> int:
+    """
+    Returns the index of the first character of a string
+    which is not displayed within the given number of columns.
+    """
+    if s.isascii():
+        return min(width, len(s))
+
+    widths = _DISPLAY_WIDTHS
+    for i, c in enumerate(s):
+        width -= widths[c]
+        if width < 0:
+            return i
+
+    return len(s)
+
+
+def wrap(s: str, width: int) -> str:
+    """
+    Breaks the lines of a string every given number of columns,
+    dropping the spaces following the breaks.
+
+    Wide characters which would overflow a line start the next one.
+    """
+    if s.isascii():
+        return _wrap_regex(width).sub("\\1\n", s)
+
+    widths = _DISPLAY_WIDTHS
+    # The wrapped chunks, joined once at the end
+    output: list[str] = []
+    start = 0
+    line_width = 0
+    length = len(s)
+    i = 0
+    while i < length:
+        c = s[i]
+        if c == "\n":
+            line_width = 0
+            i += 1
+            continue
+
+        wc = widths[c]
+        if line_width and line_width + wc > width:
+            output.append(s[start:i])
+            output.append("\n")
+            start = i
+            line_width = 0
+
+        line_width += wc
+        i += 1
+        if line_width < width:
+            continue
+
+        # Zero-width characters belong to the last character of the line
+        while i < length and s[i] != "\n" and not widths[s[i]]:
+            i += 1
+
+        output.append(s[start:i])
+        output.append("\n")
+        while i < length and s[i] == " ":
+            i += 1
+
+        start = i
+        line_width = 0
+
+    output.append(s[start:])
+
+    return "".join(output)
+
+
+@lru_cache(100)
+def _wrap_regex(width: int) -> re.Pattern[str]:
+    return re.compile(rf"([^\n]{{{width}}})\ *")
@@ -8,6 +8,8 @@ from contextlib import suppress
 from typing import TYPE_CHECKING
 from typing import cast
 
+from cleo._command_index import CommandIndex
+from cleo._utils import SimilarNameIndex
 from cleo.commands.completions_command import CompletionsCommand
 from cleo.commands.help_command import HelpCommand
 from cleo.commands.list_command import ListCommand
@@ -22,13 +24,17 @@ from cleo.exceptions import CleoError
 from cleo.exceptions import CleoLogicError
 from cleo.exceptions import CleoNamespaceNotFoundError
 from cleo.exceptions import CleoUserError
+from cleo.exceptions import CleoValueError
 from cleo.io.inputs.argument import Argument
 from cleo.io.inputs.argv_input import ArgvInput
 from cleo.io.inputs.definition import Definition
 from cleo.io.inputs.option import Option
 from cleo.io.io import IO
+from cleo.io.io import RecordFormat
+from cleo.io.outputs.background_writer import BackgroundWriter
 from cleo.io.outputs.output import Verbosity
 from cleo.io.outputs.stream_output import StreamOutput
+from cleo.loaders.command_metadata import CommandMetadata
 from cleo.terminal import Terminal
 from cleo.ui.ui import UI
 
@@ -66,6 +72,8 @@ class Application:
         self._definition: Definition | None = None
         self._catch_exceptions = True
         self._auto_exit = True
+        self._background_writer: BackgroundWriter | None = None
+        self._structured_output = False
         self._initialized = False
         self._ui: UI | None = None
 
@@ -73,6 +81,8 @@ class Application:
         self._event_dispatcher: EventDispatcher | None = None
 
         self._command_loader: CommandLoader | None = None
+        self._index: CommandIndex | None = None
+        self._suggestion_index: SimilarNameIndex | None = None
 
     @property
     def name(self) -> str:
@@ -148,6 +158,8 @@ class Application:
 
     def set_command_loader(self, command_loader: CommandLoader) -> None:
         self._command_loader = command_loader
+        self._index = None
+        self._suggestion_index = None
 
     def auto_exits(self, auto_exits: bool = True) -> None:
         self._auto_exit = auto_exits
@@ -161,6 +173,21 @@ class Application:
     def catch_exceptions(self, catch_exceptions: bool = True) -> None:
         self._catch_exceptions = catch_exceptions
 
+    def background_output(self, background_output: bool = True) -> None:
+        """
+        Makes the outputs created by the application write from a dedicated
+        thread, so that commands are not blocked by slow consumers.
+        """
+        self._background_writer = BackgroundWriter() if background_output else None
+
+    def structured_output(self, structured_output: bool = True) -> None:
+        """
+        Adds a --format option to choose how the records emitted
+        by commands are written: as text or as JSON Lines.
+        """
+        self._structured_output = structured_output
+        self._definition = None
+
     def is_single_command(self) -> bool:
         return self._single_command
 
@@ -184,6 +211,18 @@ class Application:
         for alias in command.aliases:
             self._commands[alias] = command
 
+        if self._index is not None:
+            self._index.add(command.name, command.hidden)
+
+            for alias in command.aliases:
+                self._index.add(alias, command.hidden, alias_of=command.name)
+
+        if self._suggestion_index is not None and not command.hidden:
+            self._suggestion_index.add(command.name)
+
+            for alias in command.aliases:
+                self._suggestion_index.add(alias)
+
         return command
 
     def get(self, name: str) -> Command:
@@ -222,33 +261,17 @@ class Application:
         )
 
     def get_namespaces(self) -> list[str]:
-        namespaces = []
-        seen = set()
-
-        for command in self.all().values():
-            if command.hidden or not command.name:
-                continue
-
-            for namespace in self._extract_all_namespaces(command.name):
-                if namespace in seen:
-                    continue
-
-                namespaces.append(namespace)
-                seen.add(namespace)
-
-            for alias in command.aliases:
-                for namespace in self._extract_all_namespaces(alias):
-                    if namespace in seen:
-                        continue
-
-                    namespaces.append(namespace)
-                    seen.add(namespace)
+        index = self._get_index()
+        self._resolve(index.unresolved())
 
-        return namespaces
+        return index.namespaces()
 
     def find_namespace(self, namespace: str) -> str:
-        if namespace not in (all_namespaces := self.get_namespaces()):
-            raise CleoNamespaceNotFoundError(namespace, all_namespaces)
+        index = self._get_index()
+        self._resolve(index.unresolved(namespace))
+
+        if not index.has_namespace(namespace):
+            raise CleoNamespaceNotFoundError(namespace, self.get_namespaces())
 
         return namespace
 
@@ -258,15 +281,7 @@ class Application:
         if self.has(name):
             return self.get(name)
 
-        all_commands = []
-        if self._command_loader:
-            all_commands += self._command_loader.names
-
-        all_commands += [
-            name for name, command in self._commands.items() if not command.hidden
-        ]
-
-        raise CleoCommandNotFoundError(name, all_commands)
+        raise CleoCommandNotFoundError(name, self._get_suggestion_index())
 
     def all(self, namespace: str | None = None) -> dict[str, Command]:
         self._init()
@@ -299,6 +314,39 @@ class Application:
 
         return commands
 
+    def manifest(self, namespace: str | None = None) -> dict[str, CommandMetadata]:
+        """
+        Returns the metadata of all commands, keyed by name and alias.
+
+        Commands provided by the command loader are only loaded
+        if the loader cannot describe them on its own.
+        """
+        self._init()
+
+        manifest = {}
+
+        for name, command in self._commands.items():
+            if namespace is None or namespace == self.extract_namespace(
+                name, name.count(" ") + 1
+            ):
+                manifest[name] = CommandMetadata.from_command(command)
+
+        if not self._command_loader:
+            return manifest
+
+        for name in self._command_loader.names:
+            if name in manifest or (
+                namespace is not None
+                and namespace != self.extract_namespace(name, name.count(" ") + 1)
+            ):
+                continue
+
+            metadata = self._loader_metadata(name)
+            if metadata is not None:
+                manifest[name] = metadata
+
+        return manifest
+
     def run(
         self,
         input: Input | None = None,
@@ -311,21 +359,31 @@ class Application:
             self._configure_io(io)
 
             try:
-                exit_code = self._run(io)
+                try:
+                    exit_code = self._run(io)
+                except BrokenPipeError:
+                    raise
+                except Exception as e:
+                    if not self._catch_exceptions:
+                        raise
+
+                    self.render_error(e, io)
+
+                    exit_code = 1
+                    # TODO: Custom error exit codes
+                finally:
+                    # Outputs may buffer what was written
+                    try:
+                        if self._background_writer is not None:
+                            self._background_writer.close()
+                    finally:
+                        io.flush()
             except BrokenPipeError:
                 # If we are piped to another process, it may close early and send a
                 # SIGPIPE: https://docs.python.org/3/library/signal.html#note-on-sigpipe
                 devnull = os.open(os.devnull, os.O_WRONLY)
                 os.dup2(devnull, sys.stdout.fileno())
                 exit_code = 0
-            except Exception as e:
-                if not self._catch_exceptions:
-                    raise
-
-                self.render_error(e, io)
-
-                exit_code = 1
-                # TODO: Custom error exit codes
         except KeyboardInterrupt:
             exit_code = 1
 
@@ -335,6 +393,18 @@ class Application:
         return exit_code
 
     def _run(self, io: IO) -> int:
+        if self._structured_output:
+            record_format = io.input.parameter_option("--format", "text", True)
+            # A missing value is reported when binding the input
+            if record_format is not None:
+                try:
+                    io.set_record_format(RecordFormat(record_format))
+                except ValueError:
+                    formats = ", ".join(f.value for f in RecordFormat)
+                    raise CleoValueError(
+                        f'The format "{record_format}" is not supported ({formats})'
+                    ) from None
+
         if io.input.has_parameter_option(["--version", "-V"], True):
             io.write_line(self.long_version)
 
@@ -395,13 +465,10 @@ class Application:
             # the input to parse it as a single argument
             argv = io.input._tokens[:]
 
-            if io.input.script_name is not None:
-                argv.insert(0, io.input.script_name)
-
             namespace = name.split(" ")[0]
             index = None
             for i, arg in enumerate(argv):
-                if arg == namespace and i > 0:
+                if arg == namespace:
                     argv[i] = name
                     index = i
                     break
@@ -409,11 +476,7 @@ class Application:
             if index is not None:
                 del argv[index + 1 : index + 1 + name.count(" ")]
 
-            stream = io.input.stream
-            interactive = io.input.is_interactive()
-            io.set_input(ArgvInput(argv))
-            io.input.set_stream(stream)
-            io.input.interactive(interactive)
+            io.input._set_tokens(argv)
 
         exit_code = self._run_command(command, io)
         self._running_command = None
@@ -472,16 +535,19 @@ class Application:
             input.set_stream(sys.stdin)
 
         if output is None:
-            output = StreamOutput(sys.stdout)
+            output = StreamOutput(sys.stdout, writer=self._background_writer)
 
         if error_output is None:
-            error_output = StreamOutput(sys.stderr)
+            error_output = StreamOutput(sys.stderr, writer=self._background_writer)
 
         return IO(input, output, error_output)
 
     def render_error(self, error: Exception, io: IO) -> None:
         from cleo.ui.exception_trace.component import ExceptionTrace
 
+        # The error must follow what was written to the output
+        io.output.flush()
+
         trace = ExceptionTrace(error)
         simple = not io.is_verbose() or isinstance(error, CleoUserError)
         trace.render(io.error_output, simple)
@@ -532,7 +598,7 @@ class Application:
 
     @property
     def _default_definition(self) -> Definition:
-        return Definition(
+        definition = Definition(
             [
                 Argument(
                     "command",
@@ -579,22 +645,33 @@ class Application:
             ]
         )
 
+        if self._structured_output:
+            definition.add_option(
+                Option(
+                    "--format",
+                    flag=False,
+                    description="The format of the records (text or json).",
+                    default="text",
+                )
+            )
+
+        return definition
+
     def _get_command_name(self, io: IO) -> str | None:
         if self._single_command:
             return self._default_command
 
         if "command" in io.input.arguments and io.input.argument("command"):
-            candidates: list[str] = []
-            for command_part in io.input.argument("command"):
-                if candidates:
-                    candidates.append(candidates[-1] + " " + command_part)
-                else:
-                    candidates.append(command_part)
-
-            for candidate in reversed(candidates):
+            index = self._get_index()
+            command_parts = io.input.argument("command")
+
+            while candidate := index.longest_match(command_parts):
                 if self.has(candidate):
                     return candidate
 
+                # The command loader provided a disabled command
+                index.remove(candidate)
+
         return io.input.first_argument
 
     def extract_namespace(self, name: str, limit: int | None = None) -> str:
@@ -607,14 +684,74 @@ class Application:
         io = self.create_io()
         return UI([ProgressBar(io)])
 
-    def _extract_all_namespaces(self, name: str) -> list[str]:
-        parts = name.split(" ")[:-1]
-        namespaces: list[str] = []
+    def _get_index(self) -> CommandIndex:
+        self._init()
+
+        if self._index is None:
+            index = CommandIndex()
+
+            for name, command in self._commands.items():
+                index.add(name, command.hidden)
+
+            if self._command_loader:
+                for name in self._command_loader.names:
+                    if name not in index:
+                        index.add(name, None)
+
+            self._index = index
+
+        return self._index
+
+    def _get_suggestion_index(self) -> SimilarNameIndex:
+        if self._suggestion_index is None:
+            index = SimilarNameIndex()
+
+            if self._command_loader:
+                for name in self._command_loader.names:
+                    index.add(name)
+
+            for name, command in self._commands.items():
+                if not command.hidden:
+                    index.add(name)
+
+            self._suggestion_index = index
+
+        return self._suggestion_index
+
+    def _resolve(self, names: list[str]) -> None:
+        """
+        Indexes the visibility of the given commands of the command loader.
+        """
+        # Commands of the command loader are indexed by name only,
+        # their visibility is only needed for namespaces.
+        index = self._get_index()
+        for name in names:
+            metadata = self._loader_metadata(name)
+            if metadata is None:
+                index.remove(name)
+                continue
+
+            index.add(name, metadata.hidden)
+
+            for alias in metadata.aliases:
+                if alias not in index:
+                    index.add(alias, metadata.hidden, alias_of=name)
+
+    def _loader_metadata(self, name: str) -> CommandMetadata | None:
+        """
+        Returns the metadata of a command of the command loader,
+        or None if the command is disabled.
+        """
+        assert self._command_loader is not None
+
+        metadata = self._command_loader.metadata(name)
+        if metadata is None:
+            if not (self.has(name) and name in self._commands):
+                return None
 
-        for part in parts:
-            namespaces.append(namespaces[-1] + " " + part if namespaces else part)
+            return CommandMetadata.from_command(self._commands[name])
 
-        return namespaces
+        return metadata if metadata.enabled else None
 
     def _init(self) -> None:
         if self._initialized:
@@ -8,6 +8,8 @@ from cleo.exceptions import CleoValueError
 
 
 class Color:
+    __slots__ = ("_background", "_foreground", "_options", "_set", "_unset")
+
     COLORS: ClassVar[dict[str, tuple[int, int]]] = {
         "black": (30, 40),
         "red": (31, 41),
@@ -57,35 +59,28 @@ class Color:
 
             self._options[option] = self.AVAILABLE_OPTIONS[option]
 
+        # Colors do not change, so their sequences are built once
+        self._set = self._sequence(
+            [self._foreground, self._background],
+            [option["set"] for option in self._options.values()],
+        )
+        self._unset = self._sequence(
+            ["39" if self._foreground else "", "49" if self._background else ""],
+            [option["unset"] for option in self._options.values()],
+        )
+
     def apply(self, text: str) -> str:
-        return self.set() + text + self.unset()
+        return self._set + text + self._unset
 
     def set(self) -> str:
-        codes = []
-
-        if self._foreground:
-            codes.append(self._foreground)
-
-        if self._background:
-            codes.append(self._background)
-
-        codes.extend(str(option["set"]) for option in self._options.values())
-
-        if not codes:
-            return ""
-
-        return f"\033[{';'.join(codes)}m"
+        return self._set
 
     def unset(self) -> str:
-        codes = []
-
-        if self._foreground:
-            codes.append("39")
-
-        if self._background:
-            codes.append("49")
+        return self._unset
 
-        codes.extend(str(option["unset"]) for option in self._options.values())
+    def _sequence(self, colors: list[str], options: list[int]) -> str:
+        codes = [color for color in colors if color]
+        codes.extend(map(str, options))
 
         if not codes:
             return ""
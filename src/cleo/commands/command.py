@@ -17,6 +17,7 @@ from cleo.ui.table_separator import TableSeparator
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from contextlib import AbstractContextManager
     from typing import Literal
 
@@ -333,29 +334,31 @@ class Command:
 
     def line(
         self,
-        text: str,
+        text: str | Callable[[], str],
         style: str | None = None,
         verbosity: Verbosity = Verbosity.NORMAL,
     ) -> None:
         """
         Write a string as information output.
-        """
-        styled = f"<{style}>{text}</>" if style else text
 
-        self._io.write_line(styled, verbosity=verbosity)
+        The string can be given as a callable,
+        only called if the verbosity allows it to be written.
+        """
+        self._io.write_line(self._style(text, style), verbosity=verbosity)
 
     def line_error(
         self,
-        text: str,
+        text: str | Callable[[], str],
         style: str | None = None,
         verbosity: Verbosity = Verbosity.NORMAL,
     ) -> None:
         """
         Write a string as information output to stderr.
-        """
-        styled = f"<{style}>{text}</>" if style else text
 
-        self._io.write_error_line(styled, verbosity)
+        The string can be given as a callable,
+        only called if the verbosity allows it to be written.
+        """
+        self._io.write_error_line(self._style(text, style), verbosity)
 
     def info(self, text: str) -> None:
         """
@@ -442,3 +445,17 @@ class Command:
         if necessary.
         """
         self._io.overwrite(text)
+
+    @staticmethod
+    def _style(
+        text: str | Callable[[], str], style: str | None
+    ) -> str | Callable[[], str]:
+        if not style:
+            return text
+
+        if callable(text):
+            get_text = text
+
+            return lambda: f"<{style}>{get_text()}</>"
+
+        return f"<{style}>{text}</>"
@@ -186,14 +186,14 @@ script. Consult your shells documentation for how to add such directives.
         # Commands + options
         cmds = []
         cmds_opts = []
-        for cmd in sorted(self.application.all().values(), key=lambda c: c.name or ""):
+        for cmd in sorted(self.application.manifest().values(), key=lambda c: c.name):
             if cmd.hidden or not (cmd.enabled and cmd.name):
                 continue
             command_name = shell_quote(cmd.name) if " " in cmd.name else cmd.name
             cmds.append(command_name)
             options = " ".join(
                 f"--{opt.name}".replace(":", "\\:")
-                for opt in sorted(cmd.definition.options, key=lambda o: o.name)
+                for opt in sorted(cmd.options, key=lambda o: o.name)
             )
             cmds_opts += [
                 f"            ({command_name})",
@@ -231,14 +231,14 @@ script. Consult your shells documentation for how to add such directives.
         # Commands + options
         cmds = []
         cmds_opts = []
-        for cmd in sorted(self.application.all().values(), key=lambda c: c.name or ""):
+        for cmd in sorted(self.application.manifest().values(), key=lambda c: c.name):
             if cmd.hidden or not (cmd.enabled and cmd.name):
                 continue
             command_name = shell_quote(cmd.name) if " " in cmd.name else cmd.name
             cmds.append(self._zsh_describe(command_name, sanitize(cmd.description)))
             options = " ".join(
                 self._zsh_describe(f"--{opt.name}", sanitize(opt.description))
-                for opt in sorted(cmd.definition.options, key=lambda o: o.name)
+                for opt in sorted(cmd.options, key=lambda o: o.name)
             )
             cmds_opts += [
                 f"            ({command_name})",
@@ -275,7 +275,7 @@ script. Consult your shells documentation for how to add such directives.
         cmds = []
         cmds_opts = []
         namespaces = set()
-        for cmd in sorted(self.application.all().values(), key=lambda c: c.name or ""):
+        for cmd in sorted(self.application.manifest().values(), key=lambda c: c.name):
             if cmd.hidden or not cmd.enabled or not cmd.name:
                 continue
             cmd_path = cmd.name.split(" ")
@@ -299,7 +299,7 @@ script. Consult your shells documentation for how to add such directives.
                     )
                 # Now complete the command
                 subcmds = [
-                    name.split(" ")[-1] for name in self.application.all(namespace)
+                    name.split(" ")[-1] for name in self.application.manifest(namespace)
                 ]
                 cmds.append(
                     f"complete -c {script_name} -f -n '__fish_seen_subcommand_from "
@@ -317,7 +317,7 @@ script. Consult your shells documentation for how to add such directives.
                     f"complete -c {script_name} "
                     f"-n '{condition}' "
                     f"-l {opt.name} -d '{sanitize(opt.description)}'"
-                    for opt in sorted(cmd.definition.options, key=lambda o: o.name)
+                    for opt in sorted(cmd.options, key=lambda o: o.name)
                 ],
                 "",  # newline
             ]
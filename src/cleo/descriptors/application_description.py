@@ -9,6 +9,7 @@ from cleo.exceptions import CleoCommandNotFoundError
 if TYPE_CHECKING:
     from cleo.application import Application
     from cleo.commands.command import Command
+    from cleo.loaders.command_metadata import CommandMetadata
 
 
 class ApplicationDescription:
@@ -24,8 +25,8 @@ class ApplicationDescription:
         self._namespace = namespace
         self._show_hidden = show_hidden
         self._namespaces: dict[str, dict[str, str | list[str]]] = {}
-        self._commands: dict[str, Command] = {}
-        self._aliases: dict[str, Command] = {}
+        self._commands: dict[str, CommandMetadata] = {}
+        self._aliases: dict[str, CommandMetadata] = {}
 
         self._inspect_application()
 
@@ -34,22 +35,37 @@ class ApplicationDescription:
         return self._namespaces
 
     @property
-    def commands(self) -> dict[str, Command]:
+    def metadata(self) -> dict[str, CommandMetadata]:
+        """
+        The metadata of the described commands, which are not loaded.
+        """
         return self._commands
 
-    def command(self, name: str) -> Command:
+    @property
+    def commands(self) -> dict[str, Command]:
+        """
+        The described commands, which are loaded.
+        """
+        return {name: self._application.get(name) for name in self._commands}
+
+    def command_metadata(self, name: str) -> CommandMetadata:
         if name in self._commands:
             return self._commands[name]
         if name in self._aliases:
             return self._aliases[name]
         raise CleoCommandNotFoundError(name)
 
+    def command(self, name: str) -> Command:
+        self.command_metadata(name)
+
+        return self._application.get(name)
+
     def _inspect_application(self) -> None:
         namespace = None
         if self._namespace:
             namespace = self._application.find_namespace(self._namespace)
 
-        all_commands = self._application.all(namespace)
+        all_commands = self._application.manifest(namespace)
 
         for namespace, commands in self._sort_commands(all_commands):
             names = []
@@ -68,17 +84,17 @@ class ApplicationDescription:
             self._namespaces[namespace] = {"id": namespace, "commands": names}
 
     def _sort_commands(
-        self, commands: dict[str, Command]
-    ) -> list[tuple[str, list[tuple[str, Command]]]]:
+        self, commands: dict[str, CommandMetadata]
+    ) -> list[tuple[str, list[tuple[str, CommandMetadata]]]]:
         """
         Sorts command in alphabetical order
         """
-        namespaced_commands: dict[str, dict[str, Command]] = defaultdict(dict)
+        namespaced_commands: dict[str, dict[str, CommandMetadata]] = defaultdict(dict)
         for name, command in commands.items():
             key = self._application.extract_namespace(name, 1) or "_global"
             namespaced_commands[key][name] = command
 
-        namespaced_commands_list: dict[str, list[tuple[str, Command]]] = {
+        namespaced_commands_list: dict[str, list[tuple[str, CommandMetadata]]] = {
             namespace: sorted(commands.items())
             for namespace, commands in namespaced_commands.items()
         }
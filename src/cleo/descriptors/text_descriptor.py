@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from cleo.application import Application
     from cleo.io.inputs.argument import Argument
     from cleo.io.inputs.option import Option
+    from cleo.loaders.command_metadata import CommandMetadata
 
 
 class TextDescriptor(Descriptor):
@@ -171,13 +172,13 @@ class TextDescriptor(Descriptor):
 
         self._write("\n\n")
 
-        commands = description.commands
+        commands = description.metadata
         namespaces = description.namespaces
 
         if described_namespace and namespaces:
             described_namespace_info = next(iter(namespaces.values()))
             for name in described_namespace_info["commands"]:
-                commands[name] = description.command(name)
+                commands[name] = description.command_metadata(name)
 
         # calculate max width based on available commands per namespace
         all_commands = list(commands)
@@ -270,7 +271,7 @@ class TextDescriptor(Descriptor):
 
         return max(widths) + 2
 
-    def _get_command_aliases_text(self, command: Command) -> str:
+    def _get_command_aliases_text(self, command: CommandMetadata) -> str:
         if aliases := command.aliases:
             return f"[{'|'.join(aliases)}] "
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from cleo._utils import SimilarNameIndex
 from cleo._utils import find_similar_names
 
 
@@ -48,11 +49,16 @@ class CleoMissingArgumentsError(CleoUserError):
     """
 
 
-def _suggest_similar_names(name: str, names: list[str]) -> str | None:
+def _suggest_similar_names(
+    name: str, names: list[str] | SimilarNameIndex
+) -> str | None:
     if not names:
         return None
 
-    suggested_names = find_similar_names(name, names)
+    if isinstance(names, SimilarNameIndex):
+        suggested_names = names.find(name)
+    else:
+        suggested_names = find_similar_names(name, names)
 
     if not suggested_names:
         return None
@@ -66,29 +72,52 @@ def _suggest_similar_names(name: str, names: list[str]) -> str | None:
     )
 
 
-class CleoCommandNotFoundError(CleoUserError):
+class _CleoNameNotFoundError(CleoUserError):
     """
-    Raised when called command does not exist.
+    Base exception for unknown names suggesting similar ones.
+
+    Suggestions are only computed when the message is rendered.
     """
 
-    def __init__(self, name: str, commands: list[str] | None = None) -> None:
-        message = f'The command "{name}" does not exist.'
-        if commands:
-            suggestions = _suggest_similar_names(name, commands)
-            if suggestions:
-                message += "\n\n" + suggestions
+    def __init__(
+        self, message: str, name: str, names: list[str] | SimilarNameIndex | None
+    ) -> None:
         super().__init__(message)
 
+        self._name = name
+        self._names = names
+        self._message: str | None = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = super().__str__()
+            if self._names:
+                suggestions = _suggest_similar_names(self._name, self._names)
+                if suggestions:
+                    self._message += "\n\n" + suggestions
+
+        return self._message
 
-class CleoNamespaceNotFoundError(CleoUserError):
+
+class CleoCommandNotFoundError(_CleoNameNotFoundError):
+    """
+    Raised when called command does not exist.
+    """
+
+    def __init__(
+        self, name: str, commands: list[str] | SimilarNameIndex | None = None
+    ) -> None:
+        super().__init__(f'The command "{name}" does not exist.', name, commands)
+
+
+class CleoNamespaceNotFoundError(_CleoNameNotFoundError):
     """
     Raised when called namespace has no commands.
     """
 
-    def __init__(self, name: str, namespaces: list[str] | None = None) -> None:
-        message = f'There are no commands in the "{name}" namespace.'
-        if namespaces:
-            suggestions = _suggest_similar_names(name, namespaces)
-            if suggestions:
-                message += "\n\n" + suggestions
-        super().__init__(message)
+    def __init__(
+        self, name: str, namespaces: list[str] | SimilarNameIndex | None = None
+    ) -> None:
+        super().__init__(
+            f'There are no commands in the "{name}" namespace.', name, namespaces
+        )
@@ -1,24 +1,63 @@
 from __future__ import annotations
 
 import re
+import string
+import threading
 
+from collections import OrderedDict
+from typing import Any
 from typing import ClassVar
+from typing import NamedTuple
 
+from cleo._utils import display_width
+from cleo._utils import width_index
+from cleo._utils import wrap
 from cleo.exceptions import CleoValueError
+from cleo.formatters.incremental_formatter import IncrementalFormatter
 from cleo.formatters.style import Style
 from cleo.formatters.style_stack import StyleStack
+from cleo.formatters.template import Template
+
+
+# Stands for the replacement fields while templates are formatted
+_PLACEHOLDER = "\ue000"
+
+_ESCAPE_SEQUENCE_REGEX = re.compile(r"\033\[[^m]*m")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    size: int
 
 
 class Formatter:
     TAG_REGEX = re.compile(r"(?ix)<(([a-z](?:[^<>]*)) | /([a-z](?:[^<>]*))?)>")
 
-    _inline_styles_cache: ClassVar[dict[str, Style]] = {}
+    # Styles of inline tags like <fg=red;options=bold>, shared by all formatters
+    _inline_styles_cache: ClassVar[OrderedDict[str, Style]] = OrderedDict()
+    _inline_styles_cache_size: ClassVar[int] = 256
+    _inline_styles_cache_hits: ClassVar[int] = 0
+    _inline_styles_cache_misses: ClassVar[int] = 0
+    _inline_styles_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(
-        self, decorated: bool = False, styles: dict[str, Style] | None = None
+        self,
+        decorated: bool = False,
+        styles: dict[str, Style] | None = None,
+        cache_size: int = 0,
     ) -> None:
         self._decorated = decorated
         self._styles: dict[str, Style] = {}
+        self._styles_version = 0
+
+        # Formatted messages by message, width, decoration and styles version
+        self._cache: OrderedDict[tuple[str, int, bool, int], str] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_lock = threading.Lock()
 
         self.set_style("error", Style("red", options=["bold"]))
         self.set_style("info", Style("blue"))
@@ -31,7 +70,49 @@ class Formatter:
         for name, style in (styles or {}).items():
             self.set_style(name, style)
 
-        self._style_stack = StyleStack()
+        # The style stack of each thread
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks and thread local data cannot be copied
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        del state["_local"]
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def set_inline_styles_cache_size(cls, size: int) -> None:
+        """
+        Sets the number of inline styles to cache, 0 disables the cache.
+        """
+        with cls._inline_styles_lock:
+            Formatter._inline_styles_cache_size = size
+
+            while len(cls._inline_styles_cache) > size:
+                cls._inline_styles_cache.popitem(last=False)
+
+    @classmethod
+    def inline_styles_cache_info(cls) -> CacheInfo:
+        with cls._inline_styles_lock:
+            return CacheInfo(
+                cls._inline_styles_cache_hits,
+                cls._inline_styles_cache_misses,
+                cls._inline_styles_cache_size,
+                len(cls._inline_styles_cache),
+            )
+
+    @classmethod
+    def clear_inline_styles_cache(cls) -> None:
+        with cls._inline_styles_lock:
+            cls._inline_styles_cache.clear()
+            Formatter._inline_styles_cache_hits = 0
+            Formatter._inline_styles_cache_misses = 0
 
     @classmethod
     def escape(cls, text: str) -> str:
@@ -61,6 +142,7 @@ class Formatter:
 
     def set_style(self, name: str, style: Style) -> None:
         self._styles[name] = style
+        self._styles_version += 1
 
     def has_style(self, name: str) -> bool:
         return name in self._styles
@@ -71,12 +153,81 @@ class Formatter:
 
         return self._styles[name]
 
+    def set_cache_size(self, size: int) -> None:
+        """
+        Sets the number of formatted messages to cache, 0 disables the cache.
+
+        Styles must be replaced with set_style() rather than modified
+        for the cached messages to be updated.
+        """
+        self._cache_size = size
+
+        while len(self._cache) > size:
+            self._cache.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self._cache_hits, self._cache_misses, self._cache_size, len(self._cache)
+        )
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self._cache_hits = self._cache_misses = 0
+
     def format(self, message: str) -> str:
         return self.format_and_wrap(message, 0)
 
     def format_and_wrap(self, message: str, width: int) -> str:
+        return self._format_cached(message, width, self._decorated)
+
+    def _format_cached(self, message: str, width: int, decorated: bool) -> str:
+        style_stack = self._style_stack
+
+        # Messages formatted inside unclosed tags depend on the style stack
+        if not self._cache_size or not style_stack.is_empty():
+            return self._format_and_wrap(message, width, decorated, style_stack)
+
+        key = (message, width, decorated, self._styles_version)
+        with self._cache_lock:
+            formatted = self._cache.get(key)
+            if formatted is not None:
+                self._cache_hits += 1
+                self._cache.move_to_end(key)
+
+                return formatted
+
+            self._cache_misses += 1
+
+        formatted = self._format_and_wrap(message, width, decorated, style_stack)
+
+        # Messages leaving unclosed tags must be formatted every time
+        if style_stack.is_empty():
+            with self._cache_lock:
+                self._cache[key] = formatted
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+
+        return formatted
+
+    @property
+    def _style_stack(self) -> StyleStack:
+        """
+        The style stack of the current thread, so that threads
+        can format messages with the same formatter.
+        """
+        try:
+            style_stack: StyleStack = self._local.style_stack
+        except AttributeError:
+            style_stack = self._local.style_stack = StyleStack()
+
+        return style_stack
+
+    def _format_and_wrap(
+        self, message: str, width: int, decorated: bool, style_stack: StyleStack
+    ) -> str:
         offset = 0
-        output = ""
+        # The formatted chunks, joined once at the end
+        output: list[str] = []
         current_line_length = 0
         for match in self.TAG_REGEX.finditer(message):
             pos = match.start()
@@ -86,10 +237,13 @@ class Formatter:
                 continue
 
             # add the text up to the next tag
-            formatted, current_line_length = self._apply_current_style(
-                message[offset:pos], output, width, current_line_length
+            current_line_length = self._apply_current_style(
+                message[offset:pos],
+                output,
+                width,
+                current_line_length,
+                style_stack.current if decorated else None,
             )
-            output += formatted
             offset = pos + len(text)
 
             # Opening tag
@@ -102,39 +256,137 @@ class Formatter:
 
             if not (seen_open or tag):
                 # </>
-                self._style_stack.pop()
+                style_stack.pop()
             elif style is None:
-                formatted, current_line_length = self._apply_current_style(
-                    text, output, width, current_line_length
+                current_line_length = self._apply_current_style(
+                    text,
+                    output,
+                    width,
+                    current_line_length,
+                    style_stack.current if decorated else None,
                 )
-                output += formatted
             elif seen_open:
-                self._style_stack.push(style)
+                style_stack.push(style)
             else:
-                self._style_stack.pop(style)
+                style_stack.pop(style)
+
+        self._apply_current_style(
+            message[offset:],
+            output,
+            width,
+            current_line_length,
+            style_stack.current if decorated else None,
+        )
+
+        return "".join(output).replace("\0", "\\").replace("\\<", "<")
+
+    def compile(self, template: str) -> Template:
+        """
+        Compiles a message template with replacement fields, like
+        "<info>{name}</info> {size:>8}", into a Template rendered
+        without parsing its tags again.
+
+        Fields cannot be used inside tags.
+        """
+        if _PLACEHOLDER in template:
+            raise CleoValueError("The template contains a reserved character")
+
+        fields: list[tuple[str, str, str | None]] = []
+        raw_parts = [""]
+        next_index = 0
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(
+            template
+        ):
+            raw_parts[-1] += literal
+            if field_name is None:
+                continue
+
+            if not field_name:
+                field_name = str(next_index)
+                next_index += 1
+
+            if "{" in (format_spec or ""):
+                raise CleoValueError(
+                    f'Nested replacement fields are not supported in "{template}"'
+                )
 
-        formatted, current_line_length = self._apply_current_style(
-            message[offset:], output, width, current_line_length
+            fields.append((field_name, format_spec or "", conversion))
+            raw_parts.append("")
+
+        source = _PLACEHOLDER.join(raw_parts)
+
+        decorated_parts = self._format_and_wrap(source, 0, True, StyleStack()).split(
+            _PLACEHOLDER
+        )
+        plain_parts = self._format_and_wrap(source, 0, False, StyleStack()).split(
+            _PLACEHOLDER
         )
-        output += formatted
-        return output.replace("\0", "\\").replace("\\<", "<")
+
+        if len(decorated_parts) != len(raw_parts):
+            raise CleoValueError(
+                f'Replacement fields cannot be used inside tags in "{template}"'
+            )
+
+        return Template(template, fields, raw_parts, decorated_parts, plain_parts)
+
+    def incremental(self, decorated: bool | None = None) -> IncrementalFormatter:
+        """
+        Creates an incremental formatter, to format a message fed in chunks
+        with feed() and flush().
+
+        The message is decorated like this formatter unless specified.
+        """
+        if decorated is None:
+            decorated = self._decorated
+
+        return IncrementalFormatter(self, decorated)
 
     def remove_format(self, text: str) -> str:
-        decorated = self._decorated
+        """
+        Removes the style tags and escape sequences from the text.
 
-        self._decorated = False
-        text = re.sub(r"\033\[[^m]*m", "", self.format(text))
+        Unlike format(), the text is not wrapped and no escape sequences
+        are produced, and the style stack is left untouched.
+        """
+        if "<" not in text and "\0" not in text and "\033" not in text:
+            return text
 
-        self._decorated = decorated
+        offset = 0
+        # The plain chunks, joined once at the end
+        output: list[str] = []
+        for match in self.TAG_REGEX.finditer(text):
+            pos = match.start()
+            if pos != 0 and text[pos - 1] == "\\":
+                continue
 
-        return text
+            output.append(text[offset:pos])
+            offset = match.end()
+
+            # Closing tags always close the current style
+            tag = match.group(0)
+            if tag[1] != "/" and self._create_style_from_string(match.group(1)) is None:
+                # Not a style tag, keep it as is
+                output.append(tag)
+
+        output.append(text[offset:])
+        text = "".join(output).replace("\0", "\\").replace("\\<", "<")
+
+        return _ESCAPE_SEQUENCE_REGEX.sub("", text)
 
     def _create_style_from_string(self, string: str) -> Style | None:
         if string in self._styles:
             return self._styles[string]
 
-        if string in self._inline_styles_cache:
-            return self._inline_styles_cache[string]
+        cache = self._inline_styles_cache
+        with self._inline_styles_lock:
+            cached_style = cache.get(string)
+            if cached_style is not None:
+                Formatter._inline_styles_cache_hits += 1
+                cache.move_to_end(string)
+
+                return cached_style
+
+            Formatter._inline_styles_cache_misses += 1
 
         matches = re.findall(r"([^=]+)=([^;]+)(;|$)", string.lower())
         if not matches:
@@ -154,47 +406,68 @@ class Formatter:
                 except ValueError:
                     return None
 
-        self._inline_styles_cache[string] = style
+        with self._inline_styles_lock:
+            cache[string] = style
+            while len(cache) > self._inline_styles_cache_size:
+                cache.popitem(last=False)
 
         return style
 
     def _apply_current_style(
-        self, text: str, current: str, width: int, current_line_length: int
-    ) -> tuple[str, int]:
+        self,
+        text: str,
+        output: list[str],
+        width: int,
+        current_line_length: int,
+        style: Style | None,
+    ) -> int:
+        """
+        Appends the text with the current style, if any, to the output
+        and returns the length of the current line.
+        """
         if not text:
-            return "", current_line_length
+            return current_line_length
 
         if not width:
-            if self.is_decorated():
-                return self._style_stack.current.apply(text), current_line_length
+            if style is not None:
+                text = style.apply(text)
 
-            return text, current_line_length
+            output.append(text)
 
-        if not current_line_length and current:
+            return current_line_length
+
+        # Chunks are never empty, so the last one ends the output
+        has_output = bool(output)
+
+        if not current_line_length and has_output:
             text = text.lstrip()
 
         if current_line_length:
-            i = width - current_line_length
+            i = width_index(text, width - current_line_length)
             prefix = text[:i] + "\n"
             text = text[i:]
         else:
             prefix = ""
 
-        m = re.match(r"(\n)$", text)
-        text = prefix + re.sub(rf"([^\n]{{{width}}})\ *", "\\1\n", text)
-        text = text.rstrip("\n") + (m.group(1) if m else "")
+        trailing_newline = "\n" if text in ("\n", "\n\n") else ""
+        text = prefix + wrap(text, width)
+        text = text.rstrip("\n") + trailing_newline
 
-        if not current_line_length and current and not current.endswith("\n"):
+        if not current_line_length and has_output and not output[-1].endswith("\n"):
             text = "\n" + text
 
         lines = text.split("\n")
-        for line in lines:
-            current_line_length += len(line)
-            if current_line_length >= width:
-                current_line_length = 0
+        if len(lines) > 1:
+            current_line_length = 0
+
+        current_line_length += display_width(lines[-1])
+        if current_line_length >= width:
+            current_line_length = 0
+
+        if style is not None:
+            text = "\n".join(map(style.apply, lines))
 
-        if self.is_decorated():
-            apply = self._style_stack.current.apply
-            text = "\n".join(map(apply, lines))
+        if text:
+            output.append(text)
 
-        return text, current_line_length
+        return current_line_length
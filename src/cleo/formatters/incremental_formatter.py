@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+
+from typing import TYPE_CHECKING
+
+from cleo.formatters.style_stack import StyleStack
+
+
+if TYPE_CHECKING:
+    from cleo.formatters.formatter import Formatter
+
+
+# A tag which may still be completed by the next chunk
+_PARTIAL_TAG_REGEX = re.compile(r"(?i)<(?:/?[a-z][^<>]*|/)?\Z")
+
+
+class IncrementalFormatter:
+    """
+    Formats a message fed in chunks, like the output of a subprocess.
+
+    Tags may be split across chunks: the end of a chunk which may be
+    the beginning of a tag, or of an escape sequence, is held back until
+    the next chunk, so the formatted text only depends on the whole
+    message. Unclosed tags style the following chunks.
+
+    Held back text never exceeds MAX_TAG_LENGTH characters, longer
+    partial tags are output as text.
+
+    Incremental formatters are created with Formatter.incremental().
+    """
+
+    MAX_TAG_LENGTH = 1024
+
+    def __init__(self, formatter: Formatter, decorated: bool) -> None:
+        self._formatter = formatter
+        self._decorated = decorated
+        self._style_stack = StyleStack()
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """
+        Formats the given chunk and returns the text that can be output.
+        """
+        text = self._pending + chunk
+        end = len(text)
+
+        start = text.rfind("<")
+        if (
+            start != -1
+            and end - start <= self.MAX_TAG_LENGTH
+            and (start == 0 or text[start - 1] != "\\")
+            and _PARTIAL_TAG_REGEX.match(text, start)
+        ):
+            end = start
+        elif text.endswith(("\\", "\0")):
+            # It may escape a "<" starting the next chunk
+            end -= 1
+
+        self._pending = text[end:]
+
+        return self._format(text[:end])
+
+    def flush(self) -> str:
+        """
+        Formats the text held back and closes all the tags,
+        so that the formatter can be fed a new message.
+        """
+        text = self._pending
+        self._pending = ""
+        formatted = self._format(text)
+        self._style_stack.reset()
+
+        return formatted
+
+    def _format(self, text: str) -> str:
+        if not text:
+            return ""
+
+        return self._formatter._format_and_wrap(
+            text, 0, self._decorated, self._style_stack
+        )
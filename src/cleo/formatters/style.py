@@ -4,6 +4,8 @@ from cleo.color import Color
 
 
 class Style:
+    __slots__ = ("_background", "_color", "_foreground", "_key", "_options")
+
     def __init__(
         self,
         foreground: str | None = None,
@@ -14,16 +16,24 @@ class Style:
         self._background = background or ""
         self._options = options or []
 
-        self._color = Color(self._foreground, self._background, self._options)
+        self._set_color(Color(self._foreground, self._background, self._options))
+
+    @property
+    def key(self) -> str:
+        """
+        The escape sequences of the style, equal for styles
+        which render the same.
+        """
+        return self._key
 
     def foreground(self, foreground: str) -> Style:
-        self._color = Color(foreground, self._background, self._options)
+        self._set_color(Color(foreground, self._background, self._options))
         self._foreground = foreground
 
         return self
 
     def background(self, background: str) -> Style:
-        self._color = Color(self._foreground, background, self._options)
+        self._set_color(Color(self._foreground, background, self._options))
         self._background = background
 
         return self
@@ -51,14 +61,14 @@ class Style:
 
     def set_option(self, option: str) -> Style:
         self._options.append(option)
-        self._color = Color(self._foreground, self._background, self._options)
+        self._set_color(Color(self._foreground, self._background, self._options))
         return self
 
     def unset_option(self, option: str) -> Style:
         if option in self._options:
             index = self._options.index(option)
             del self._options[index]
-            self._color = Color(self._foreground, self._background, self._options)
+            self._set_color(Color(self._foreground, self._background, self._options))
         return self
 
     def _toggle_option(self, toggle_flag: bool, option: str) -> Style:
@@ -66,3 +76,7 @@ class Style:
 
     def apply(self, text: str) -> str:
         return self._color.apply(text)
+
+    def _set_color(self, color: Color) -> None:
+        self._color = color
+        self._key = color.apply("")
@@ -19,6 +19,9 @@ class StyleStack:
 
         return self._styles[-1]
 
+    def is_empty(self) -> bool:
+        return not self._styles
+
     def reset(self) -> None:
         self._styles = []
 
@@ -32,11 +35,12 @@ class StyleStack:
         if style is None:
             return self._styles.pop()
 
-        sample = style.apply("")
+        key = style.key
 
-        for i, stacked_style in reversed(list(enumerate(self._styles))):
-            if sample == stacked_style.apply(""):
-                self._styles = self._styles[:i]
+        for i in range(len(self._styles) - 1, -1, -1):
+            stacked_style = self._styles[i]
+            if key == stacked_style.key:
+                del self._styles[i:]
                 return stacked_style
 
         raise CleoValueError("Invalid nested tag found")
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import string
+
+from typing import Any
+
+
+class Template:
+    """
+    A message template whose tags have been formatted once.
+
+    The template is split around its replacement fields into parts
+    already formatted with and without decoration, so rendering it only
+    formats the values and concatenates them with the parts. Values are
+    inserted as they are and never parsed for tags.
+
+    Templates are created with Formatter.compile().
+    """
+
+    def __init__(
+        self,
+        source: str,
+        fields: list[tuple[str, str, str | None]],
+        raw_parts: list[str],
+        decorated_parts: list[str],
+        plain_parts: list[str],
+    ) -> None:
+        self._source = source
+        self._fields = fields
+        self._raw_parts = raw_parts
+        self._decorated_parts = decorated_parts
+        self._plain_parts = plain_parts
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+    def render(self, *args: Any, **kwargs: Any) -> TemplateMessage:
+        """
+        Renders the template with the given values for its fields.
+        """
+        formatter = _FIELD_FORMATTER
+        values = []
+        for field_name, format_spec, conversion in self._fields:
+            value, _ = formatter.get_field(field_name, args, kwargs)
+            if conversion:
+                value = formatter.convert_field(value, conversion)
+
+            values.append(format(value, format_spec))
+
+        return TemplateMessage(self, values)
+
+    def join(self, values: list[str], decorated: bool | None) -> str:
+        """
+        Joins rendered values with the decorated or plain parts,
+        or with the raw parts, tags included, if decorated is None.
+        """
+        if decorated is None:
+            parts = self._raw_parts
+        elif decorated:
+            parts = self._decorated_parts
+        else:
+            parts = self._plain_parts
+
+        chunks = [parts[0]]
+        for value, part in zip(values, parts[1:]):
+            chunks.append(value)
+            chunks.append(part)
+
+        return "".join(chunks)
+
+
+class TemplateMessage:
+    """
+    A rendered template, which outputs write without formatting it again.
+    """
+
+    def __init__(self, template: Template, values: list[str]) -> None:
+        self._template = template
+        self._values = values
+
+    def format(self, decorated: bool = False) -> str:
+        return self._template.join(self._values, decorated)
+
+    def __str__(self) -> str:
+        # The raw message, tags included
+        return self._template.join(self._values, None)
+
+    def __repr__(self) -> str:
+        return f"TemplateMessage({self.format()!r})"
+
+
+_FIELD_FORMATTER = string.Formatter()
@@ -12,6 +12,7 @@ def argument(
     optional: bool = False,
     multiple: bool = False,
     default: Any | None = None,
+    response_files: bool = False,
 ) -> Argument:
     return Argument(
         name,
@@ -19,6 +20,7 @@ def argument(
         is_list=multiple,
         description=description,
         default=default,
+        response_files=response_files,
     )
 
 
@@ -17,12 +17,19 @@ class Argument:
         is_list: bool = False,
         description: str | None = None,
         default: Any | None = None,
+        response_files: bool = False,
     ) -> None:
+        if response_files and not is_list:
+            raise CleoLogicError(
+                "Only list arguments can have values read from response files"
+            )
+
         self._name = name
         self._required = required
         self._is_list = is_list
         self._description = description or ""
         self._default: str | list[str] | None = None
+        self._response_files = response_files
 
         self.set_default(default)
 
@@ -44,6 +51,9 @@ class Argument:
     def is_list(self) -> bool:
         return self._is_list
 
+    def accepts_response_files(self) -> bool:
+        return self._response_files
+
     def set_default(self, default: Any | None = None) -> None:
         if self._required and default is not None:
             raise CleoLogicError("Cannot set a default value for required arguments")
@@ -64,5 +74,6 @@ class Argument:
             f"required={self._required}, "
             f"is_list={self._is_list}, "
             f"description={self._description!r}, "
-            f"default={self._default!r})"
+            f"default={self._default!r}, "
+            f"response_files={self._response_files})"
         )
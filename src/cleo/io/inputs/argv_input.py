@@ -8,12 +8,92 @@ from typing import Any
 from cleo.exceptions import CleoNoSuchOptionError
 from cleo.exceptions import CleoRuntimeError
 from cleo.io.inputs.input import Input
+from cleo.io.inputs.response_file_values import ResponseFileValues
 
 
 if TYPE_CHECKING:
+    from cleo.io.inputs.argument import Argument
     from cleo.io.inputs.definition import Definition
 
 
+# Kinds of the items the tokens are classified into
+_OPTION = 0
+_ARGUMENTS = 1
+_TERMINATOR = 2
+
+
+class _OptionIndex:
+    """
+    An index of the raw tokens preceding the "--" terminator,
+    to look up options without scanning all the tokens.
+    """
+
+    def __init__(self, tokens: list[str]) -> None:
+        self._tokens = tokens
+        self._terminator = len(tokens)
+        # The first position of each token
+        self._exact: dict[str, int] = {}
+        # The first position of "--option=value" tokens by option
+        self._long: dict[str, int] = {}
+        # The positions of "-abc" tokens by their first two characters
+        self._short: dict[str, list[int]] = {}
+
+        for i, token in enumerate(tokens):
+            if token == "--":
+                self._terminator = i
+                break
+
+            self._exact.setdefault(token, i)
+
+            if token.startswith("--"):
+                pos = token.find("=")
+                if pos != -1:
+                    self._long.setdefault(token[:pos], i)
+            elif token.startswith("-") and len(token) > 1:
+                self._short.setdefault(token[:2], []).append(i)
+
+    def find(self, value: str, only_params: bool = False) -> int | None:
+        """
+        Returns the position of the first token equal to the value
+        or starting with it (followed by "=" for long options).
+        """
+        prefix_position: int | None
+        if value.startswith("--") and "=" not in value:
+            prefix_position = self._long.get(value)
+        elif value.startswith("-") and not value.startswith("--") and value != "-":
+            prefix_position = next(
+                (
+                    i
+                    for i in self._short.get(value[:2], [])
+                    if self._tokens[i].startswith(value)
+                ),
+                None,
+            )
+        elif value == "":
+            prefix_position = None
+        else:
+            # Other values may be the beginning of any token, so scan them all.
+            return self._scan(value, 0, self._terminator if only_params else None)
+
+        position = self._first(self._exact.get(value), prefix_position)
+        if position is not None or only_params:
+            return position
+
+        return self._scan(value, self._terminator, None)
+
+    def _first(self, *positions: int | None) -> int | None:
+        return min((p for p in positions if p is not None), default=None)
+
+    def _scan(self, value: str, start: int, end: int | None) -> int | None:
+        leading = value + "=" if value.startswith("--") else value
+
+        for i, token in enumerate(self._tokens[start:end], start):
+            if token == value or (leading != "" and token.startswith(leading)):
+                return i
+
+        return None
+
+
 class ArgvInput(Input):
     """
     Represents an input coming from the command line.
@@ -34,7 +114,14 @@ class ArgvInput(Input):
             self._script_name = None
 
         self._tokens = argv
-        self._parsed: list[str] = []
+        # The tokens classified into options and runs of arguments,
+        # as (kind, start, end) ranges of tokens
+        self._items: list[tuple[int, int, int]] | None = None
+        # Position of the next item to parse
+        self._cursor = 0
+        # Number of tokens of the next item used as an option value
+        self._consumed = 0
+        self._option_index: _OptionIndex | None = None
 
         super().__init__(definition=definition)
 
@@ -87,20 +174,7 @@ class ArgvInput(Input):
         if not isinstance(values, list):
             values = [values]
 
-        for token in self._tokens:
-            if only_params and token == "--":
-                return False
-
-            for value in values:
-                # Options with values:
-                # For long options, test for '--option=' at beginning
-                # For short options, test for '-o' at beginning
-                leading = value + "=" if value.startswith("--") else value
-
-                if token == value or (leading != "" and token.startswith(leading)):
-                    return True
-
-        return False
+        return self._find_parameter_option(values, only_params) is not None
 
     def parameter_option(
         self,
@@ -111,58 +185,136 @@ class ArgvInput(Input):
         if not isinstance(values, list):
             values = [values]
 
-        tokens = self._tokens[:]
-        while tokens:
-            token = tokens.pop(0)
-            if only_params and token == "--":
-                return default
+        match = self._find_parameter_option(values, only_params)
+        if match is None:
+            return default
+
+        position, value = match
+        token = self._tokens[position]
+        if token == value:
+            if position + 1 < len(self._tokens):
+                return self._tokens[position + 1]
 
-            for value in values:
-                if token == value:
-                    try:
-                        return tokens.pop(0)
-                    except IndexError:
-                        return None
+            return None
 
-                # Options with values:
-                # For long options, test for '--option=' at beginning
-                # For short options, test for '-o' at beginning
-                leading = value + "=" if value.startswith("--") else value
+        # Options with values:
+        # For long options, test for '--option=' at beginning
+        # For short options, test for '-o' at beginning
+        leading = value + "=" if value.startswith("--") else value
 
-                if token == value or (leading != "" and token.startswith(leading)):
-                    return token[len(leading)]
+        return token[len(leading) :]
+
+    def _find_parameter_option(
+        self, values: list[str], only_params: bool
+    ) -> tuple[int, str] | None:
+        """
+        Returns the position of the first token matching one of the values
+        along with the matched value.
+        """
+        if self._option_index is None:
+            self._option_index = _OptionIndex(self._tokens)
 
-        return False
+        match = None
+        for value in values:
+            position = self._option_index.find(value, only_params)
+            if position is not None and (match is None or position < match[0]):
+                match = (position, value)
+
+        return match
 
     def _set_tokens(self, tokens: list[str]) -> None:
         self._tokens = tokens
+        self._items = None
+        self._option_index = None
+
+    def _get_items(self) -> list[tuple[int, int, int]]:
+        """
+        Classifies the tokens once so that binding the input
+        to successive definitions does not scan every token.
+        """
+        if self._items is not None:
+            return self._items
+
+        items = []
+        tokens = self._tokens
+        run_start = None
+
+        for i, token in enumerate(tokens):
+            if token.startswith("-") and token != "-":
+                if run_start is not None:
+                    items.append((_ARGUMENTS, run_start, i))
+                    run_start = None
+
+                if token == "--":
+                    items.append((_TERMINATOR, i, i + 1))
+                    if i + 1 < len(tokens):
+                        items.append((_ARGUMENTS, i + 1, len(tokens)))
+
+                    break
+
+                items.append((_OPTION, i, i + 1))
+            elif run_start is None:
+                run_start = i
+        else:
+            if run_start is not None:
+                items.append((_ARGUMENTS, run_start, len(tokens)))
+
+        self._items = items
+
+        return items
 
     def _parse(self) -> None:
-        parse_options = True
-        self._parsed = self._tokens[:]
+        items = self._get_items()
+        self._cursor = 0
+        self._consumed = 0
+
+        while self._cursor < len(items):
+            kind, start, end = items[self._cursor]
+            self._cursor += 1
+
+            if kind == _ARGUMENTS:
+                self._parse_arguments(start + self._consumed, end)
+                self._consumed = 0
+            elif kind == _OPTION:
+                token = self._tokens[start]
+                if token.startswith("--"):
+                    self._parse_long_option(token)
+                else:
+                    self._parse_short_option(token)
+
+    def _parse_arguments(self, start: int, end: int) -> None:
+        while start < end:
+            argument = self._next_list_argument()
+            if argument is not None:
+                # A list argument takes all the remaining tokens at once
+                if argument.name not in self._arguments:
+                    self._arguments[argument.name] = (
+                        ResponseFileValues(lambda: self._stream)
+                        if argument.accepts_response_files()
+                        else []
+                    )
 
-        try:
-            token = self._parsed.pop(0)
-        except IndexError:
-            return
-
-        while token is not None:
-            if parse_options and token == "":
-                self._parse_argument(token)
-            elif parse_options and token == "--":
-                parse_options = False
-            elif parse_options and token.startswith("--"):
-                self._parse_long_option(token)
-            elif parse_options and token.startswith("-") and token != "-":
-                self._parse_short_option(token)
-            else:
-                self._parse_argument(token)
+                self._arguments[argument.name].extend(self._tokens[start:end])
 
-            try:
-                token = self._parsed.pop(0)
-            except IndexError:
                 return
 
+            self._parse_argument(self._tokens[start])
+            start += 1
+
+    def _next_list_argument(self) -> Argument | None:
+        """
+        Returns the argument receiving the next token if it is a list.
+        """
+        next_argument = len(self._arguments)
+        if self._definition.has_argument(next_argument):
+            argument = self._definition.argument(next_argument)
+        elif self._definition.has_argument(next_argument - 1):
+            argument = self._definition.argument(next_argument - 1)
+        else:
+            return None
+
+        return argument if argument.is_list() else None
+
     def _parse_short_option(self, token: str) -> None:
         name = token[1:]
 
@@ -201,11 +353,7 @@ class ArgvInput(Input):
 
         pos = name.find("=")
         if pos != -1:
-            value = name[pos + 1 :]
-            if not value:
-                self._parsed.insert(0, value)
-
-            self._add_long_option(name[:pos], value)
+            self._add_long_option(name[:pos], name[pos + 1 :])
         else:
             self._add_long_option(name, None)
 
@@ -268,14 +416,14 @@ class ArgvInput(Input):
         if not (value is None or option.accepts_value()):
             raise CleoRuntimeError(f'The "--{name}" option does not accept a value')
 
-        if value in ("", None) and option.accepts_value() and self._parsed:
+        items = self._get_items()
+        if value is None and option.accepts_value() and self._cursor < len(items):
             # If the option accepts a value, either required or optional,
             # we check if there is one
-            next_token = self._parsed.pop(0)
-            if not next_token.startswith("-") or next_token in ("", None):
+            next_token = self._tokens[items[self._cursor][1]]
+            if not next_token.startswith("-"):
                 value = next_token
-            else:
-                self._parsed.insert(0, next_token)
+                self._consumed = 1
 
         if value is None:
             if option.requires_value():
@@ -22,6 +22,8 @@ class Definition:
 
     def __init__(self, definition: Sequence[Argument | Option] | None = None) -> None:
         self._arguments: dict[str, Argument] = {}
+        # The arguments by position
+        self._argument_list: list[Argument] = []
         self._required_count = 0
         self._has_list_argument = False
         self._has_optional = False
@@ -32,7 +34,7 @@ class Definition:
 
     @property
     def arguments(self) -> list[Argument]:
-        return list(self._arguments.values())
+        return self._argument_list[:]
 
     @property
     def argument_count(self) -> int:
@@ -77,6 +79,7 @@ class Definition:
 
     def set_arguments(self, arguments: list[Argument]) -> None:
         self._arguments = {}
+        self._argument_list = []
         self._required_count = 0
         self._has_list_argument = False
         self._has_optional = False
@@ -107,14 +110,14 @@ class Definition:
             self._has_optional = True
 
         self._arguments[argument.name] = argument
+        self._argument_list.append(argument)
 
     def argument(self, name: str | int) -> Argument:
         if not self.has_argument(name):
             raise ValueError(f'The "{name}" argument does not exist')
 
         if isinstance(name, int):
-            arguments = list(self._arguments.values())
-            return arguments[name]
+            return self._argument_list[name]
 
         return self._arguments[name]
 
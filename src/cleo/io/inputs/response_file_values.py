@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import sys
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from cleo.exceptions import CleoRuntimeError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from typing import TextIO
+
+
+class ResponseFileValues:
+    """
+    The values of a list argument which can be read from response files.
+
+    A "@path" token is replaced by the lines of the file at this path
+    and "@-" by the lines of the input stream. A leading "@@" stands for
+    a literal "@". Files are only read, line by line, while the values
+    are iterated, so they are never entirely loaded in memory, and are
+    read again by every iteration. The input stream can only be read
+    once, so its values are kept, as they are read, for the following
+    iterations.
+    """
+
+    def __init__(self, stream: Callable[[], TextIO | None] | None = None) -> None:
+        self._tokens: list[str] = []
+        self._stream = stream
+        # The values read from the input stream, None until it is read
+        self._stream_values: list[str] | None = None
+        self._stream_lines: Iterator[str] | None = None
+
+    @property
+    def tokens(self) -> list[str]:
+        """
+        The raw tokens, before response files are read.
+        """
+        return self._tokens
+
+    def extend(self, tokens: list[str]) -> None:
+        for token in tokens:
+            path = self._response_file(token)
+            if path is not None and path != "-" and not Path(path).is_file():
+                raise CleoRuntimeError(f'The response file "{path}" does not exist')
+
+        self._tokens.extend(tokens)
+
+    def __iter__(self) -> Iterator[str]:
+        for token in self._tokens:
+            path = self._response_file(token)
+            if path is None:
+                yield token[1:] if token.startswith("@@") else token
+            elif path == "-":
+                yield from self._read_stream()
+            else:
+                yield from self._read_file(Path(path))
+
+    def __repr__(self) -> str:
+        return f"ResponseFileValues({self._tokens!r})"
+
+    def _response_file(self, token: str) -> str | None:
+        if len(token) < 2 or token[0] != "@" or token[1] == "@":
+            return None
+
+        return token[1:]
+
+    def _read_file(self, path: Path) -> Iterator[str]:
+        # Lines are decoded like command line arguments
+        with path.open("rb") as f:
+            for line in f:
+                value = line.rstrip(b"\r\n")
+                if value:
+                    yield os.fsdecode(value)
+
+    def _read_stream(self) -> Iterator[str]:
+        if self._stream_values is None:
+            stream = self._stream() if self._stream is not None else None
+            if stream is None:
+                stream = sys.stdin
+
+            self._stream_values = []
+            self._stream_lines = iter(stream)
+
+        values = self._stream_values
+        i = 0
+        while True:
+            if i < len(values):
+                yield values[i]
+                i += 1
+                continue
+
+            if self._stream_lines is None:
+                return
+
+            line = next(self._stream_lines, None)
+            if line is None:
+                self._stream_lines = None
+                return
+
+            value = line.rstrip("\r\n")
+            if value:
+                values.append(value)
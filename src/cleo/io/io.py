@@ -1,24 +1,45 @@
 from __future__ import annotations
 
+import json
+
+from enum import Enum
 from typing import TYPE_CHECKING
+from typing import Any
 
+from cleo.formatters.formatter import Formatter
 from cleo.io.outputs.output import Type as OutputType
 from cleo.io.outputs.output import Verbosity
+from cleo.io.outputs.stream_output import StreamOutput
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from typing import BinaryIO
 
     from cleo.io.inputs.input import Input
+    from cleo.io.outputs.output import Messages
     from cleo.io.outputs.output import Output
     from cleo.io.outputs.section_output import SectionOutput
 
 
+class RecordFormat(Enum):
+    """
+    How the records emitted by IO.emit() are written.
+    """
+
+    # Rendered for humans, like any other message
+    TEXT = "text"
+    # Serialized as JSON Lines, one record per line
+    JSON = "json"
+
+
 class IO:
     def __init__(self, input: Input, output: Output, error_output: Output) -> None:
         self._input = input
         self._output = output
         self._error_output = error_output
+        self._record_format = RecordFormat.TEXT
+        self._has_emitted = False
 
     @property
     def input(self) -> Input:
@@ -32,21 +53,30 @@ class IO:
     def error_output(self) -> Output:
         return self._error_output
 
+    @property
+    def record_format(self) -> RecordFormat:
+        return self._record_format
+
     def read(self, length: int, default: str = "") -> str:
         """
         Reads the given amount of characters from the input stream.
         """
+        # Prompts must be written before waiting for the answer
+        self.flush()
+
         return self._input.read(length, default=default)
 
     def read_line(self, length: int = -1, default: str = "") -> str:
         """
         Reads a line from the input stream.
         """
+        self.flush()
+
         return self._input.read_line(length=length, default=default)
 
     def write_line(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: OutputType = OutputType.NORMAL,
     ) -> None:
@@ -54,7 +84,7 @@ class IO:
 
     def write(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         new_line: bool = False,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: OutputType = OutputType.NORMAL,
@@ -63,24 +93,79 @@ class IO:
 
     def write_error_line(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: OutputType = OutputType.NORMAL,
     ) -> None:
+        self._flush_output(verbosity)
         self._error_output.write_line(messages, verbosity=verbosity, type=type)
 
     def write_error(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         new_line: bool = False,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: OutputType = OutputType.NORMAL,
     ) -> None:
+        self._flush_output(verbosity)
         self._error_output.write(
             messages, new_line=new_line, verbosity=verbosity, type=type
         )
 
-    def overwrite(self, messages: str | Iterable[str]) -> None:
+    def write_bytes(self, data: bytes, verbosity: Verbosity = Verbosity.NORMAL) -> None:
+        self._output.write_bytes(data, verbosity=verbosity)
+
+    def write_error_bytes(
+        self, data: bytes, verbosity: Verbosity = Verbosity.NORMAL
+    ) -> None:
+        self._flush_output(verbosity)
+        self._error_output.write_bytes(data, verbosity=verbosity)
+
+    def copy_from(self, file: BinaryIO, verbosity: Verbosity = Verbosity.NORMAL) -> int:
+        return self._output.copy_from(file, verbosity=verbosity)
+
+    def emit(
+        self, record: Mapping[str, Any], verbosity: Verbosity = Verbosity.NORMAL
+    ) -> None:
+        """
+        Writes a record to the output, as a table of its fields
+        or, for machines, as a JSON line bypassing the formatter.
+
+        Records are written as they are emitted, so every record is
+        rendered as its own table, separated from the previous one by
+        an empty line. None values are left empty.
+        """
+        if verbosity.value > self._output.verbosity.value:
+            return
+
+        if self._record_format is RecordFormat.JSON:
+            self._output.write_line(
+                json.dumps(record, ensure_ascii=False, default=str),
+                type=OutputType.RAW,
+            )
+            return
+
+        from cleo.ui.table import Table
+
+        if self._has_emitted:
+            self._output.write_line("")
+
+        self._has_emitted = True
+
+        table = Table(self._output, style="compact")
+        table.set_headers([Formatter.escape(str(key)) for key in record])
+        table.set_rows(
+            [
+                [
+                    "" if value is None else Formatter.escape(str(value))
+                    for value in record.values()
+                ]
+            ]
+        )
+        table.horizontal()
+        table.render()
+
+    def overwrite(self, messages: Messages) -> None:
         from cleo.cursor import Cursor
 
         cursor = Cursor(self._output)
@@ -88,7 +173,7 @@ class IO:
         cursor.clear_line()
         self.write(messages)
 
-    def overwrite_error(self, messages: str | Iterable[str]) -> None:
+    def overwrite_error(self, messages: Messages) -> None:
         from cleo.cursor import Cursor
 
         cursor = Cursor(self._error_output)
@@ -98,6 +183,7 @@ class IO:
 
     def flush(self) -> None:
         self._output.flush()
+        self._error_output.flush()
 
     def is_interactive(self) -> bool:
         return self._input.is_interactive()
@@ -128,14 +214,43 @@ class IO:
     def is_debug(self) -> bool:
         return self.output.is_debug()
 
+    def set_record_format(self, record_format: RecordFormat) -> None:
+        self._record_format = record_format
+
     def set_input(self, input: Input) -> None:
         self._input = input
 
     def with_input(self, input: Input) -> IO:
-        return self.__class__(input, self._output, self._error_output)
+        io = self.__class__(input, self._output, self._error_output)
+        io.set_record_format(self._record_format)
+
+        return io
 
     def remove_format(self, text: str) -> str:
         return self._output.remove_format(text)
 
     def section(self) -> SectionOutput:
         return self._output.section()
+
+    def _flush_output(self, verbosity: Verbosity) -> None:
+        """
+        Flushes the output before writing to the error output,
+        so that what was written to the output comes first.
+        """
+        if verbosity.value > self._error_output.verbosity.value:
+            return
+
+        output = self._output
+        error_output = self._error_output
+        if (
+            isinstance(output, StreamOutput)
+            and isinstance(error_output, StreamOutput)
+            and output.writer is not None
+            and output.writer is error_output.writer
+        ):
+            # The writes of both outputs are already ordered,
+            # only the stream of the output must be flushed in turn
+            output.writer.submit(output._flush_stream)
+            return
+
+        output.flush()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import queue
+import threading
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class BackgroundWriter:
+    """
+    Writes to the streams of outputs from a dedicated thread,
+    so that commands are not blocked by slow consumers.
+
+    Writes are done in the order they were submitted, so outputs sharing
+    a writer keep the order of their writes, and submitting blocks while
+    max_size writes are waiting. An error raised by a write is raised
+    again by the next call to submit(), drain() or close().
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self._queue: queue.Queue[Callable[[], object] | None] = queue.Queue(max_size)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._error: Exception | None = None
+
+    def submit(self, write: Callable[[], object]) -> None:
+        # Closing must not run concurrently, or another thread could be started
+        with self._lock:
+            self._raise_error()
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="cleo-background-writer", daemon=True
+                )
+                self._thread.start()
+
+            self._queue.put(write)
+
+    def drain(self) -> None:
+        """
+        Waits for all the submitted writes to be done.
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Waits for all the submitted writes to be done and stops the thread,
+        which is started again by the next write.
+        """
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+
+        self._raise_error()
+
+    def _run(self) -> None:
+        while True:
+            write = self._queue.get()
+            try:
+                if write is None:
+                    return
+
+                # The writes following an error are dropped
+                if self._error is None:
+                    write()
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        error = self._error
+        if error is not None:
+            self._error = None
+
+            raise error
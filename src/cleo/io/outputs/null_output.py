@@ -8,7 +8,9 @@ from cleo.io.outputs.output import Verbosity
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from typing import BinaryIO
+
+    from cleo.io.outputs.output import Messages
 
 
 class NullOutput(Output):
@@ -42,7 +44,7 @@ class NullOutput(Output):
 
     def write_line(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: Type = Type.NORMAL,
     ) -> None:
@@ -50,13 +52,19 @@ class NullOutput(Output):
 
     def write(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         new_line: bool = False,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: Type = Type.NORMAL,
     ) -> None:
         pass
 
+    def write_bytes(self, data: bytes, verbosity: Verbosity = Verbosity.NORMAL) -> None:
+        pass
+
+    def copy_from(self, file: BinaryIO, verbosity: Verbosity = Verbosity.NORMAL) -> int:
+        return 0
+
     def flush(self) -> None:
         pass
 
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import codecs
+
+from collections.abc import Callable
+from collections.abc import Iterable
 from enum import Enum
 from typing import TYPE_CHECKING
+from typing import Union
 
 from cleo._utils import strip_tags
 from cleo.formatters.formatter import Formatter
+from cleo.formatters.template import TemplateMessage
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from typing import BinaryIO
 
     from cleo.io.outputs.section_output import SectionOutput
 
 
+Message = Union[str, TemplateMessage]
+# Messages can be given as a callable, only called when they are written
+Messages = Union[
+    Message, Iterable[Message], Callable[[], Union[Message, Iterable[Message]]]
+]
+
+
 class Verbosity(Enum):
     QUIET = 16
     NORMAL = 32
@@ -28,6 +41,9 @@ class Type(Enum):
 
 
 class Output:
+    COPY_BUFFER_SIZE = 64 * 1024
+    WRITE_BUFFER_SIZE = 64 * 1024
+
     def __init__(
         self,
         verbosity: Verbosity = Verbosity.NORMAL,
@@ -80,7 +96,7 @@ class Output:
 
     def write_line(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: Type = Type.NORMAL,
     ) -> None:
@@ -88,24 +104,56 @@ class Output:
 
     def write(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         new_line: bool = False,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: Type = Type.NORMAL,
     ) -> None:
-        if isinstance(messages, str):
-            messages = [messages]
+        if verbosity.value > self.verbosity.value:
+            return
 
+        if callable(messages):
+            messages = messages()
+
+        if isinstance(messages, (str, TemplateMessage)):
+            self._write(self._format(messages, type), new_line=new_line)
+            return
+
+        # Messages are written in batches of about WRITE_BUFFER_SIZE characters
+        batch: list[str] = []
+        size = 0
+        try:
+            for message in messages:
+                formatted = self._format(message, type)
+                batch.append(formatted)
+                size += len(formatted)
+
+                if size >= self.WRITE_BUFFER_SIZE:
+                    self._write_batch(batch, new_line=new_line)
+                    batch = []
+                    size = 0
+        finally:
+            if batch:
+                self._write_batch(batch, new_line=new_line)
+
+    def write_bytes(self, data: bytes, verbosity: Verbosity = Verbosity.NORMAL) -> None:
+        """
+        Writes already encoded data as is, without formatting it.
+        """
         if verbosity.value > self.verbosity.value:
             return
 
-        for message in messages:
-            if type is Type.NORMAL:
-                message = self._formatter.format(message)
-            elif type is Type.PLAIN:
-                message = strip_tags(self._formatter.format(message))
+        self._write_bytes(data)
 
-            self._write(message, new_line=new_line)
+    def copy_from(self, file: BinaryIO, verbosity: Verbosity = Verbosity.NORMAL) -> int:
+        """
+        Writes the content of a binary file, from its current position,
+        as is and returns the number of bytes written.
+        """
+        if verbosity.value > self.verbosity.value:
+            return 0
+
+        return self._copy_from(file)
 
     def flush(self) -> None:
         pass
@@ -116,5 +164,50 @@ class Output:
     def section(self) -> SectionOutput:
         raise NotImplementedError
 
+    def _format(self, message: Message, type: Type) -> str:
+        if isinstance(message, TemplateMessage):
+            # Templates were formatted when compiled
+            if type is Type.NORMAL:
+                return message.format(self.is_decorated())
+            if type is Type.PLAIN:
+                return strip_tags(message.format())
+
+            return str(message)
+
+        if type is Type.NORMAL:
+            return self._formatter.format(message)
+        if type is Type.PLAIN:
+            return strip_tags(self._formatter.remove_format(message))
+
+        return message
+
     def _write(self, message: str, new_line: bool = False) -> None:
         raise NotImplementedError
+
+    def _write_batch(self, messages: list[str], new_line: bool = False) -> None:
+        """
+        Writes several formatted messages at once.
+        """
+        if new_line:
+            self._write("\n".join(messages), new_line=True)
+        else:
+            self._write("".join(messages))
+
+    def _write_bytes(self, data: bytes) -> None:
+        # Outputs without a binary stream write the decoded data
+        self._write(data.decode(errors="replace"))
+
+    def _copy_from(self, file: BinaryIO) -> int:
+        # The characters split between chunks are decoded once complete
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        size = 0
+        while True:
+            data = file.read(self.COPY_BUFFER_SIZE)
+            text = decoder.decode(data, final=not data)
+            if text:
+                self._write(text)
+
+            if not data:
+                return size
+
+            size += len(data)
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import codecs
 import math
 
 from typing import TYPE_CHECKING
 from typing import TextIO
 
+from cleo._utils import display_width
 from cleo.io.outputs.output import Verbosity
 from cleo.io.outputs.stream_output import StreamOutput
 from cleo.terminal import Terminal
 
 
 if TYPE_CHECKING:
+    from typing import BinaryIO
+
     from cleo.formatters.formatter import Formatter
+    from cleo.io.outputs.background_writer import BackgroundWriter
+    from cleo.io.outputs.stream_output import FlushPolicy
 
 
 class SectionOutput(StreamOutput):
@@ -22,9 +28,18 @@ class SectionOutput(StreamOutput):
         verbosity: Verbosity = Verbosity.NORMAL,
         decorated: bool | None = None,
         formatter: Formatter | None = None,
+        flush_policy: FlushPolicy | None = None,
+        flush_interval: float = 1.0,
+        writer: BackgroundWriter | None = None,
     ) -> None:
         super().__init__(
-            stream, verbosity=verbosity, decorated=decorated, formatter=formatter
+            stream,
+            verbosity=verbosity,
+            decorated=decorated,
+            formatter=formatter,
+            flush_policy=flush_policy,
+            flush_interval=flush_interval,
+            writer=writer,
         )
 
         self._content: list[str] = []
@@ -66,7 +81,9 @@ class SectionOutput(StreamOutput):
         for line_content in content.split("\n"):
             self._lines += (
                 math.ceil(
-                    len(self.remove_format(line_content).replace("\t", " " * 8))
+                    display_width(
+                        self.remove_format(line_content).replace("\t", " " * 8)
+                    )
                     / self._terminal.width
                 )
                 or 1
@@ -86,6 +103,45 @@ class SectionOutput(StreamOutput):
         super()._write(message, new_line=True)
         super()._write(erased_content, new_line=False)
 
+    def _write_batch(self, messages: list[str], new_line: bool = False) -> None:
+        if new_line or not self.is_decorated():
+            super()._write_batch(messages, new_line=new_line)
+            return
+
+        # Every write of a section ends a line
+        for message in messages:
+            self._write(message)
+
+    def _write_bytes(self, data: bytes) -> None:
+        if not self.is_decorated():
+            super()._write_bytes(data)
+            return
+
+        # The content of sections is kept as text
+        self._write(data.decode(errors="replace"))
+
+    def _copy_from(self, file: BinaryIO) -> int:
+        if not self.is_decorated():
+            return super()._copy_from(file)
+
+        # Every write of a section ends a line, so only whole lines are written
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        size = 0
+        while True:
+            data = file.read(self.COPY_BUFFER_SIZE)
+            text = pending + decoder.decode(data, final=not data)
+            if not data:
+                if text:
+                    self._write(text)
+
+                return size
+
+            size += len(data)
+            lines, new_line, pending = text.rpartition("\n")
+            if new_line:
+                self._write(lines)
+
     def _pop_stream_content_until_current_section(
         self, lines_to_clear_count: int = 0
     ) -> str:
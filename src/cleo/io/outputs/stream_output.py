@@ -5,7 +5,12 @@ import io
 import locale
 import os
 import sys
+import threading
+import time
 
+from contextlib import suppress
+from enum import Enum
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import TextIO
 from typing import cast
@@ -15,23 +20,48 @@ from cleo.io.outputs.output import Verbosity
 
 
 if TYPE_CHECKING:
+    from typing import BinaryIO
+
     from cleo.formatters.formatter import Formatter
+    from cleo.io.outputs.background_writer import BackgroundWriter
     from cleo.io.outputs.section_output import SectionOutput
 
 
+class FlushPolicy(Enum):
+    """
+    When a StreamOutput flushes its stream after writing to it.
+    """
+
+    # After every write
+    ALWAYS = 1
+    # After writes ending lines
+    LINE = 2
+    # Once flush_interval seconds have passed since the first write not flushed
+    INTERVAL = 3
+    # Only when flush() is called, leaving the stream to buffer writes
+    EXPLICIT = 4
+
+
 class StreamOutput(Output):
     FILE_TYPE_CHAR = 0x0002
     FILE_TYPE_REMOTE = 0x8000
     ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
 
+    # The maximum number of bytes copied by a single sendfile() call
+    SENDFILE_SIZE = 1024 * 1024 * 1024
+
     def __init__(
         self,
         stream: TextIO,
         verbosity: Verbosity = Verbosity.NORMAL,
         decorated: bool | None = None,
         formatter: Formatter | None = None,
+        flush_policy: FlushPolicy | None = None,
+        flush_interval: float = 1.0,
+        writer: BackgroundWriter | None = None,
     ) -> None:
         self._stream = stream
+        self._writer = writer
         self._supports_utf8 = self._get_utf8_support_info()
         super().__init__(
             verbosity=verbosity,
@@ -39,10 +69,45 @@ class StreamOutput(Output):
             formatter=formatter,
         )
 
+        # Terminals are flushed after every write,
+        # pipes and files only from time to time
+        if flush_policy is None:
+            flush_policy = (
+                FlushPolicy.ALWAYS if self._is_terminal() else FlushPolicy.INTERVAL
+            )
+
+        self._flush_policy = flush_policy
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        # Held while using the stream, which the interval timer flushes
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+
     @property
     def stream(self) -> TextIO:
         return self._stream
 
+    @property
+    def writer(self) -> BackgroundWriter | None:
+        return self._writer
+
+    @property
+    def flush_policy(self) -> FlushPolicy:
+        return self._flush_policy
+
+    @property
+    def flush_interval(self) -> float:
+        return self._flush_interval
+
+    def set_flush_policy(
+        self, flush_policy: FlushPolicy, flush_interval: float | None = None
+    ) -> None:
+        self.flush()
+
+        self._flush_policy = flush_policy
+        if flush_interval is not None:
+            self._flush_interval = flush_interval
+
     def supports_utf8(self) -> bool:
         return self._supports_utf8
 
@@ -63,25 +128,149 @@ class StreamOutput(Output):
             return True
 
     def flush(self) -> None:
-        self._stream.flush()
+        if self._writer is not None:
+            self._writer.drain()
+
+        self._flush_stream()
 
     def section(self) -> SectionOutput:
         from cleo.io.outputs.section_output import SectionOutput
 
-        return SectionOutput(
+        section = SectionOutput(
             self._stream,
             self._section_outputs,
             verbosity=self.verbosity,
             decorated=self.is_decorated(),
             formatter=self.formatter,
+            flush_policy=self._flush_policy,
+            flush_interval=self._flush_interval,
+            writer=self._writer,
         )
+        # Sections write to the same stream
+        section._lock = self._lock
+
+        return section
 
     def _write(self, message: str, new_line: bool = False) -> None:
         if new_line:
             message += "\n"
 
-        self._stream.write(message)
-        self._stream.flush()
+        if self._writer is not None:
+            self._writer.submit(partial(self._write_to_stream, message))
+        else:
+            self._write_to_stream(message)
+
+    def _write_to_stream(self, message: str) -> None:
+        with self._lock:
+            self._stream.write(message)
+            self._apply_flush_policy(message.endswith("\n"))
+
+    def _write_bytes(self, data: bytes) -> None:
+        if not hasattr(self._stream, "buffer"):
+            super()._write_bytes(data)
+        elif self._writer is not None:
+            self._writer.submit(partial(self._write_bytes_to_stream, data))
+        else:
+            self._write_bytes_to_stream(data)
+
+    def _write_bytes_to_stream(self, data: bytes) -> None:
+        with self._lock:
+            # The text written before must be output first
+            self._stream.flush()
+            self._stream.buffer.write(data)
+            self._apply_flush_policy(data.endswith(b"\n"))
+
+    def _copy_from(self, file: BinaryIO) -> int:
+        if self._writer is not None:
+            self._writer.drain()
+
+        if not hasattr(os, "sendfile"):
+            return self._copy_chunks(file)
+
+        try:
+            out_fd = self._stream.fileno()
+            in_fd = file.fileno()
+            # The file may have read ahead of its position
+            offset = file.tell()
+        except (AttributeError, OSError, ValueError):
+            return self._copy_chunks(file)
+
+        self._flush_stream()
+
+        size = 0
+        while True:
+            try:
+                sent = os.sendfile(out_fd, in_fd, offset + size, self.SENDFILE_SIZE)
+            except OSError:
+                if size:
+                    raise
+
+                # The file or the stream does not support sendfile()
+                return self._copy_chunks(file)
+
+            if not sent:
+                break
+
+            size += sent
+
+        file.seek(offset + size)
+        self._last_flush = time.monotonic()
+
+        return size
+
+    def _copy_chunks(self, file: BinaryIO) -> int:
+        if not hasattr(self._stream, "buffer"):
+            return super()._copy_from(file)
+
+        size = 0
+        while True:
+            data = file.read(self.COPY_BUFFER_SIZE)
+            if not data:
+                return size
+
+            self._write_bytes(data)
+            size += len(data)
+
+    def _apply_flush_policy(self, ends_line: bool) -> None:
+        flush_policy = self._flush_policy
+        if flush_policy is FlushPolicy.ALWAYS:
+            self._stream.flush()
+        elif flush_policy is FlushPolicy.LINE:
+            if ends_line:
+                self._stream.flush()
+        elif flush_policy is FlushPolicy.INTERVAL:
+            elapsed = time.monotonic() - self._last_flush
+            if elapsed >= self._flush_interval:
+                self._flush_stream()
+            elif self._timer is None:
+                # What is written before a pause must not wait for the next write
+                self._timer = threading.Timer(
+                    self._flush_interval - elapsed, self._flush_after_interval
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_after_interval(self) -> None:
+        with self._lock:
+            self._timer = None
+
+            # Errors are raised again by the next write or flush
+            with suppress(OSError, ValueError):
+                self._flush_stream()
+
+    def _flush_stream(self) -> None:
+        with self._lock:
+            self._stream.flush()
+            self._last_flush = time.monotonic()
+
+    def _is_terminal(self) -> bool:
+        if not hasattr(self._stream, "fileno"):
+            return False
+
+        try:
+            return os.isatty(self._stream.fileno())
+        except io.UnsupportedOperation:
+            return False
 
     def _has_color_support(self) -> bool:
         # Follow https://no-color.org/
@@ -152,10 +341,4 @@ class StreamOutput(Output):
                 != 0,
             )
 
-        if not hasattr(self._stream, "fileno"):
-            return False
-
-        try:
-            return os.isatty(self._stream.fileno())
-        except io.UnsupportedOperation:
-            return False
+        return self._is_terminal()
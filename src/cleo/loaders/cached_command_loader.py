@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from cleo.exceptions import CleoCommandNotFoundError
+from cleo.loaders.command_loader import CommandLoader
+from cleo.loaders.command_metadata import CommandMetadata
+
+
+if TYPE_CHECKING:
+    from cleo.commands.command import Command
+
+
+CACHE_FORMAT = 1
+
+
+def default_cache_dir(app_name: str) -> Path:
+    """
+    Returns the directory in which the application should store its caches.
+    """
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(base) / app_name
+
+
+class CachedCommandLoader(CommandLoader):
+    """
+    A command loader persisting the metadata of the commands
+    of another loader on disk.
+
+    The cache is keyed by the application version and by the modification
+    time and size of the modules defining the commands. It is rebuilt,
+    by loading every command once, as soon as one of them changes.
+
+    Usage:
+    >>> loader = CachedCommandLoader(
+    ...     FactoryCommandLoader(factories),
+    ...     default_cache_dir("myapp") / "commands.json",
+    ...     version="1.0",
+    ... )
+    >>> app.set_command_loader(loader)
+    """
+
+    def __init__(
+        self, loader: CommandLoader, path: str | Path, version: str = ""
+    ) -> None:
+        self._loader = loader
+        self._path = Path(path)
+        self._version = version
+        self._manifest: dict[str, CommandMetadata] | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def names(self) -> list[str]:
+        return self._loader.names
+
+    def has(self, name: str) -> bool:
+        return self._loader.has(name)
+
+    def get(self, name: str) -> Command:
+        return self._loader.get(name)
+
+    def metadata(self, name: str) -> CommandMetadata | None:
+        if not self._loader.has(name):
+            raise CleoCommandNotFoundError(name)
+
+        if self._manifest is None:
+            self._manifest = self._load()
+
+        if self._manifest is None or name not in self._manifest:
+            self._manifest = self._build()
+
+        return self._manifest.get(name)
+
+    def clear(self) -> None:
+        """
+        Removes the cache file.
+        """
+        self._manifest = None
+        self._path.unlink(missing_ok=True)
+
+    def _load(self) -> dict[str, CommandMetadata] | None:
+        try:
+            with self._path.open(encoding="utf-8") as f:
+                data = json.load(f)
+
+            if (
+                data["format"] != CACHE_FORMAT
+                or data["version"] != self._version
+                or set(data["commands"]) != set(self._loader.names)
+            ):
+                return None
+
+            for source, signature in data["sources"].items():
+                if self._signature(source) != signature:
+                    return None
+
+            return {
+                name: CommandMetadata.from_dict(metadata)
+                for name, metadata in data["commands"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _build(self) -> dict[str, CommandMetadata]:
+        manifest: dict[str, CommandMetadata] = {}
+        sources: dict[str, list[int]] = {}
+
+        for name in self._loader.names:
+            metadata = self._loader.metadata(name)
+            if metadata is None:
+                command = self._loader.get(name)
+                metadata = CommandMetadata.from_command(command)
+
+                module = sys.modules.get(type(command).__module__)
+                source = getattr(module, "__file__", None)
+                if source and (signature := self._signature(source)) is not None:
+                    sources[source] = signature
+
+            manifest[name] = metadata
+
+        self._save(manifest, sources)
+
+        return manifest
+
+    def _save(
+        self, manifest: dict[str, CommandMetadata], sources: dict[str, list[int]]
+    ) -> None:
+        data: dict[str, Any] = {
+            "format": CACHE_FORMAT,
+            "version": self._version,
+            "sources": sources,
+            "commands": {
+                name: metadata.to_dict() for name, metadata in manifest.items()
+            },
+        }
+
+        # Caching is best effort: unserializable defaults or
+        # an unwritable cache directory leave the cache untouched.
+        with suppress(OSError, TypeError, ValueError):
+            content = json.dumps(data)
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(content, encoding="utf-8")
+            tmp_path.replace(self._path)
+
+    def _signature(self, source: str) -> list[int] | None:
+        try:
+            stat = Path(source).stat()
+        except OSError:
+            return None
+
+        return [stat.st_mtime_ns, stat.st_size]
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from cleo.commands.command import Command
+    from cleo.loaders.command_metadata import CommandMetadata
 
 
 class CommandLoader:
@@ -26,3 +27,10 @@ class CommandLoader:
         Checks whether a command exists or not.
         """
         raise NotImplementedError
+
+    def metadata(self, name: str) -> CommandMetadata | None:
+        """
+        Returns the static metadata of a command without loading it,
+        or None if the loader has to load the command to know it.
+        """
+        return None
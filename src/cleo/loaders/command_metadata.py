@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+
+from cleo.io.inputs.argument import Argument
+from cleo.io.inputs.option import Option
+
+
+if TYPE_CHECKING:
+    from cleo.commands.command import Command
+
+
+@dataclass
+class CommandMetadata:
+    """
+    Static information about a command that can be read
+    without instantiating the command or importing its module.
+    """
+
+    name: str
+    description: str = ""
+    aliases: list[str] = field(default_factory=list)
+    hidden: bool = False
+    enabled: bool = True
+    arguments: list[Argument] = field(default_factory=list)
+    options: list[Option] = field(default_factory=list)
+
+    @classmethod
+    def from_command(cls, command: Command) -> CommandMetadata:
+        return cls(
+            name=command.name or "",
+            description=command.description,
+            aliases=list(command.aliases),
+            hidden=command.hidden,
+            enabled=command.enabled,
+            arguments=command.definition.arguments,
+            options=command.definition.options,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CommandMetadata:
+        return cls(
+            name=data["name"],
+            description=data["description"],
+            aliases=data["aliases"],
+            hidden=data["hidden"],
+            enabled=data["enabled"],
+            arguments=[
+                Argument(
+                    argument["name"],
+                    required=argument["required"],
+                    is_list=argument["is_list"],
+                    description=argument["description"],
+                    default=argument["default"],
+                )
+                for argument in data["arguments"]
+            ],
+            options=[
+                Option(
+                    option["name"],
+                    option["shortcut"],
+                    flag=option["flag"],
+                    requires_value=option["requires_value"],
+                    is_list=option["is_list"],
+                    description=option["description"],
+                    default=option["default"],
+                )
+                for option in data["options"]
+            ],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns a JSON serializable representation of the metadata.
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "aliases": self.aliases,
+            "hidden": self.hidden,
+            "enabled": self.enabled,
+            "arguments": [
+                {
+                    "name": argument.name,
+                    "required": argument.is_required(),
+                    "is_list": argument.is_list(),
+                    "description": argument.description,
+                    "default": None if argument.is_required() else argument.default,
+                }
+                for argument in self.arguments
+            ],
+            "options": [
+                {
+                    "name": option.name,
+                    "shortcut": option.shortcut,
+                    "flag": option.is_flag(),
+                    "requires_value": option.requires_value(),
+                    "is_list": option.is_list(),
+                    "description": option.description,
+                    "default": None if option.is_flag() else option.default,
+                }
+                for option in self.options
+            ],
+        }
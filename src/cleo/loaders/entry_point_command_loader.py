@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import cast
+
+from cleo.exceptions import CleoCommandNotFoundError
+from cleo.loaders.command_loader import CommandLoader
+from cleo.loaders.import_path_command_loader import import_object
+
+
+if TYPE_CHECKING:
+    from cleo.commands.command import Command
+
+
+INDEX_FORMAT = 1
+
+
+class EntryPointCommandLoader(CommandLoader):
+    """
+    A command loader discovering commands from an entry point group.
+
+    The name of each entry point is the command name and its value
+    points to a command class or factory, e.g.:
+
+        [project.entry-points."myapp.commands"]
+        "db migrate" = "myapp.commands.db:MigrateCommand"
+
+    Scanning entry points is slow, so the discovered commands are recorded
+    in an index file that is only refreshed when distributions are
+    installed or removed. Modules are imported when their command is loaded.
+    """
+
+    def __init__(self, group: str, index_path: str | Path | None = None) -> None:
+        self._group = group
+        self._index_path = Path(index_path) if index_path is not None else None
+        self._index: dict[str, str] | None = None
+
+    @property
+    def group(self) -> str:
+        return self._group
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._get_index())
+
+    def has(self, name: str) -> bool:
+        return name in self._get_index()
+
+    def get(self, name: str) -> Command:
+        index = self._get_index()
+        if name not in index:
+            raise CleoCommandNotFoundError(name)
+
+        return cast("Command", import_object(index[name])())
+
+    def _get_index(self) -> dict[str, str]:
+        if self._index is not None:
+            return self._index
+
+        if self._index_path is None:
+            self._index = self._discover()
+
+            return self._index
+
+        fingerprint = self._fingerprint()
+        index = self._load_index(self._index_path, fingerprint)
+        if index is None:
+            index = self._discover()
+            self._save_index(self._index_path, fingerprint, index)
+
+        self._index = index
+
+        return self._index
+
+    def _discover(self) -> dict[str, str]:
+        from importlib.metadata import entry_points
+
+        if sys.version_info >= (3, 10):
+            eps = entry_points(group=self._group)
+        else:
+            eps = entry_points().get(self._group, [])
+
+        index: dict[str, str] = {}
+        for ep in eps:
+            # The first distribution providing a command wins
+            index.setdefault(ep.name, ep.value)
+
+        return index
+
+    def _fingerprint(self) -> str:
+        """
+        Computes a fingerprint of the installed distributions.
+
+        Installing, upgrading or removing a distribution adds or removes
+        its metadata directory, which updates the modification time
+        of the corresponding sys.path entry.
+        """
+        fingerprint = hashlib.sha256(self._group.encode())
+        for entry in sys.path:
+            try:
+                mtime = Path(entry or ".").stat().st_mtime_ns
+            except OSError:
+                continue
+
+            fingerprint.update(f"{entry}\0{mtime}\0".encode())
+
+        return fingerprint.hexdigest()
+
+    def _load_index(self, path: Path, fingerprint: str) -> dict[str, str] | None:
+        try:
+            with path.open(encoding="utf-8") as f:
+                data = json.load(f)
+
+            if data["format"] != INDEX_FORMAT or data["fingerprint"] != fingerprint:
+                return None
+
+            return cast("dict[str, str]", data["commands"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_index(self, path: Path, fingerprint: str, index: dict[str, str]) -> None:
+        data = {"format": INDEX_FORMAT, "fingerprint": fingerprint, "commands": index}
+
+        with suppress(OSError):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(path)
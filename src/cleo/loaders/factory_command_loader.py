@@ -1,22 +1,35 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from cleo.commands.command import Command
 from cleo.exceptions import CleoCommandNotFoundError
 from cleo.loaders.command_loader import CommandLoader
 
 
+if TYPE_CHECKING:
+    from cleo.loaders.command_metadata import CommandMetadata
+
+
 Factory = Callable[[], Command]
 
 
 class FactoryCommandLoader(CommandLoader):
     """
     A simple command loader using factories to instantiate commands lazily.
+
+    An optional manifest of command metadata lets listings, help and
+    completions describe the commands without calling their factories.
     """
 
-    def __init__(self, factories: dict[str, Factory]) -> None:
+    def __init__(
+        self,
+        factories: dict[str, Factory],
+        manifest: dict[str, CommandMetadata] | None = None,
+    ) -> None:
         self._factories = factories
+        self._manifest = manifest or {}
 
     @property
     def names(self) -> list[str]:
@@ -30,3 +43,9 @@ class FactoryCommandLoader(CommandLoader):
             raise CleoCommandNotFoundError(name)
 
         return self._factories[name]()
+
+    def metadata(self, name: str) -> CommandMetadata | None:
+        if name not in self._factories:
+            raise CleoCommandNotFoundError(name)
+
+        return self._manifest.get(name)
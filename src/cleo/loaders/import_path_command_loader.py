@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import importlib
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+
+from cleo.exceptions import CleoCommandNotFoundError
+from cleo.exceptions import CleoValueError
+from cleo.loaders.command_loader import CommandLoader
+
+
+if TYPE_CHECKING:
+    from cleo.commands.command import Command
+    from cleo.loaders.command_metadata import CommandMetadata
+    from cleo.loaders.factory_command_loader import Factory
+
+
+def import_object(path: str) -> Any:
+    """
+    Imports the object referenced by a "package.module:attribute" path.
+    """
+    module_name, _, attributes = path.partition(":")
+    module_name = module_name.strip()
+    if not module_name:
+        raise CleoValueError(f'"{path}" is not a valid import path')
+
+    obj: Any = importlib.import_module(module_name)
+    for attribute in filter(None, attributes.strip().split(".")):
+        obj = getattr(obj, attribute)
+
+    return obj
+
+
+class ImportPathCommandLoader(CommandLoader):
+    """
+    A command loader importing commands from "package.module:Class" paths.
+
+    Command modules are only imported when the command is loaded,
+    so unknown or unused commands never trigger an import.
+
+    Usage:
+    >>> loader = ImportPathCommandLoader(
+    ...     {"db migrate": "myapp.commands.db:MigrateCommand"}
+    ... )
+    >>> app.set_command_loader(loader)
+    """
+
+    def __init__(
+        self,
+        paths: dict[str, str],
+        manifest: dict[str, CommandMetadata] | None = None,
+    ) -> None:
+        self._paths = paths
+        self._manifest = manifest or {}
+        self._factories: dict[str, Factory] = {}
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._paths)
+
+    def has(self, name: str) -> bool:
+        return name in self._paths
+
+    def get(self, name: str) -> Command:
+        if name not in self._paths:
+            raise CleoCommandNotFoundError(name)
+
+        if name not in self._factories:
+            self._factories[name] = cast("Factory", import_object(self._paths[name]))
+
+        return self._factories[name]()
+
+    def metadata(self, name: str) -> CommandMetadata | None:
+        if name not in self._paths:
+            raise CleoCommandNotFoundError(name)
+
+        return self._manifest.get(name)
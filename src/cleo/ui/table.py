@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING
 from typing import Union
 from typing import cast
 
+from cleo._utils import display_width
+from cleo._utils import width_index
 from cleo.formatters.formatter import Formatter
 from cleo.io.outputs.output import Output
 from cleo.ui.table_cell import TableCell
@@ -293,7 +295,7 @@ class Table:
         if title is not None:
             assert title_format is not None
             formatted_title = title_format.format(title)
-            title_length = len(self._io.remove_format(formatted_title))
+            title_length = display_width(self._io.remove_format(formatted_title))
             markup_length = len(markup)
             limit = markup_length - 4
 
@@ -301,7 +303,7 @@ class Table:
                 title_length = limit
                 format_length = len(self._io.remove_format(title_format.format("")))
                 formatted_title = title_format.format(
-                    title[: limit - format_length - 3] + "..."
+                    title[: width_index(title, limit - format_length - 3)] + "..."
                 )
 
             title_start = (markup_length - title_length) // 2
@@ -372,7 +374,7 @@ class Table:
         if isinstance(cell, TableSeparator):
             return style.border_format.format(style.border_chars[2] * width)
 
-        width += len(cell) - len(self._io.remove_format(cell))
+        width += len(cell) - display_width(self._io.remove_format(cell))
         content = style.cell_row_content_format.format(cell)
 
         pad = style.pad
@@ -425,7 +427,7 @@ class Table:
 
                 if column in self._column_max_widths and self._column_max_widths[
                     column
-                ] < len(self._io.remove_format(cell)):
+                ] < display_width(self._io.remove_format(cell)):
                     assert isinstance(self._io, Output)
                     cell = self._io.formatter.format_and_wrap(
                         cell, self._column_max_widths[column] * colspan
@@ -670,7 +672,7 @@ class Table:
 
         with suppress(IndexError):
             cell = row[column]
-            cell_width = len(self._io.remove_format(cell))
+            cell_width = display_width(self._io.remove_format(cell))
 
         column_width = self._column_widths.get(column, 0)
         cell_width = max(cell_width, column_width)
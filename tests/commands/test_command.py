@@ -6,6 +6,7 @@ from typing import ClassVar
 from cleo.application import Application
 from cleo.commands.command import Command
 from cleo.helpers import argument
+from cleo.io.outputs.output import Verbosity
 from cleo.testers.command_tester import CommandTester
 from tests.fixtures.inherited_command import ChildCommand
 from tests.fixtures.signature_command import SignatureCommand
@@ -31,6 +32,19 @@ class MyCommand(Command):
         self.write("Processing...")
         self.overwrite("Done!")
 
+    def _lazy_line(self) -> None:
+        self.line(lambda: "foo", "info")
+        self.line(lambda: "bar", verbosity=Verbosity.VERBOSE)
+        self.line_error(lambda: "baz", "comment", verbosity=Verbosity.DEBUG)
+
+    def _debug_lines(self) -> None:
+        def text() -> str:
+            raise AssertionError("Skipped lines must not be evaluated")
+
+        for _ in range(100_000):
+            self.line(text, "comment", verbosity=Verbosity.DEBUG)
+            self.line_error(text, verbosity=Verbosity.VERBOSE)
+
 
 class MySecondCommand(Command):
     name = "test2"
@@ -45,6 +59,14 @@ class MySecondCommand(Command):
         return 0
 
 
+def test_skipped_lazy_lines_are_not_evaluated() -> None:
+    tester = CommandTester(MyCommand())
+
+    assert tester.execute("debug_lines") == 0
+    assert tester.io.fetch_output() == ""
+    assert tester.io.fetch_error() == ""
+
+
 def test_set_application() -> None:
     application = Application()
     command = Command()
@@ -87,3 +109,17 @@ def test_explicit_multiple_argument() -> None:
     tester.execute("1 2 3")
 
     assert tester.io.fetch_output() == "1,2,3\n"
+
+
+def test_line_with_lazy_text() -> None:
+    tester = CommandTester(MyCommand())
+
+    tester.execute("lazy_line", decorated=True)
+
+    assert tester.io.fetch_output() == "\x1b[34mfoo\x1b[39m\n"
+    assert tester.io.fetch_error() == ""
+
+    tester.execute("lazy_line", verbosity=Verbosity.DEBUG, decorated=False)
+
+    assert tester.io.fetch_output() == "foo\nbar\n"
+    assert tester.io.fetch_error() == "baz\n"
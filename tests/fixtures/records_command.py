@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from cleo.commands.command import Command
+
+
+class RecordsCommand(Command):
+    name = "records"
+
+    description = "The records command"
+
+    def handle(self) -> int:
+        self.io.emit({"name": "foo", "version": "1.0"})
+        self.io.emit({"name": "<bar>", "version": None})
+
+        return 0
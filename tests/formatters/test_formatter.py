@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import copy
+import threading
+
+from typing import TYPE_CHECKING
+
 import pytest
 
+from cleo.exceptions import CleoValueError
+from cleo.formatters.formatter import CacheInfo
 from cleo.formatters.formatter import Formatter
+from cleo.formatters.style import Style
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 @pytest.mark.parametrize(
@@ -101,3 +113,223 @@ def test_format_and_wrap_undecorated(text: str, width: int, expected: str) -> No
     formatter = Formatter(False)
 
     assert formatter.format_and_wrap(text, width) == expected
+
+
+@pytest.mark.parametrize(
+    ["text", "width", "expected"],
+    [
+        ("日本語のテキスト", 5, "日本\n語の\nテキ\nスト"),
+        ("ab <info>日本語</info>のテキスト", 5, "ab 日\n本語\nのテ\nキス\nト"),
+        ("foo\nbar <info>baz</info>", 7, "foo\nbar baz"),
+    ],
+)
+def test_format_and_wrap_display_width(text: str, width: int, expected: str) -> None:
+    formatter = Formatter(False)
+
+    assert formatter.format_and_wrap(text, width) == expected
+
+
+def test_format_large_plain_text() -> None:
+    formatter = Formatter(True)
+    text = "a" * 1_000_000
+
+    assert formatter.format(text) == text
+    assert formatter.format_and_wrap(text, 100) == "\n".join(
+        [text[i : i + 100] for i in range(0, len(text), 100)]
+    )
+
+
+def test_format_many_tags() -> None:
+    formatter = Formatter(True)
+
+    assert (
+        formatter.format("<info>foo</info> " * 100_000)
+        == "\x1b[34mfoo\x1b[39m " * 100_000
+    )
+    assert Formatter(False).format_and_wrap(
+        "<info>foo</info> " * 10_000, 4
+    ) == "\n".join(["foo "] * 10_000)
+
+
+def test_format_deeply_nested_tags() -> None:
+    formatter = Formatter(True)
+    depth = 10_000
+
+    assert (
+        formatter.format("<info>" * depth + "foo" + "</info>" * depth + "bar")
+        == "\x1b[34mfoo\x1b[39mbar"
+    )
+    assert (
+        formatter.format("<comment><info>" * depth + "foo" + "</>" * 2 * depth)
+        == "\x1b[34mfoo\x1b[39m"
+    )
+
+
+def test_format_with_cache() -> None:
+    formatter = Formatter(True, cache_size=2)
+
+    assert formatter.format("<info>foo</info>") == "\x1b[34mfoo\x1b[39m"
+    assert formatter.format("<info>foo</info>") == "\x1b[34mfoo\x1b[39m"
+    assert formatter.format_and_wrap("<info>foo</info>", 2) == (
+        "\x1b[34mfo\x1b[39m\n\x1b[34mo\x1b[39m"
+    )
+    assert formatter.cache_info() == CacheInfo(1, 2, 2, 2)
+
+    formatter.decorated(False)
+
+    assert formatter.format("<info>foo</info>") == "foo"
+    assert formatter.cache_info() == CacheInfo(1, 3, 2, 2)
+
+    formatter.decorated(True)
+    formatter.set_style("info", Style("red"))
+
+    assert formatter.format("<info>foo</info>") == "\x1b[31mfoo\x1b[39m"
+    assert formatter.cache_info() == CacheInfo(1, 4, 2, 2)
+
+    formatter.clear_cache()
+
+    assert formatter.cache_info() == CacheInfo(0, 0, 2, 0)
+
+
+def test_format_with_cache_ignores_unclosed_tags() -> None:
+    formatter = Formatter(True, cache_size=10)
+
+    assert formatter.format("<info>foo") == "\x1b[34mfoo\x1b[39m"
+    assert formatter.format("bar") == "\x1b[34mbar\x1b[39m"
+    assert formatter.format("</info>bar") == "bar"
+    assert formatter.format("bar") == "bar"
+    assert formatter.format("bar") == "bar"
+    assert formatter.cache_info() == CacheInfo(1, 2, 10, 1)
+
+
+def test_compile() -> None:
+    formatter = Formatter(True)
+    template = formatter.compile("<info>{name}</info> {size:>4} {{}} {!r}")
+
+    message = template.render("<b>", name="<error>foo</error>", size=12)
+
+    assert template.source == "<info>{name}</info> {size:>4} {{}} {!r}"
+    assert message.format(True) == "\x1b[34m<error>foo</error>\x1b[39m   12 {} '<b>'"
+    assert message.format(False) == "<error>foo</error>   12 {} '<b>'"
+    assert str(message) == "<info><error>foo</error></info>   12 {} '<b>'"
+
+
+def test_compile_does_not_change_formatter_state() -> None:
+    formatter = Formatter(True)
+    formatter.format("<info>")
+
+    formatter.compile("<error>{}</error>")
+
+    assert formatter.is_decorated()
+    assert formatter.format("foo") == "\x1b[34mfoo\x1b[39m"
+
+
+@pytest.mark.parametrize("template", ["<fg={color}>foo</>", "{:{width}}", "\ue000"])
+def test_compile_invalid_template(template: str) -> None:
+    with pytest.raises(CleoValueError):
+        Formatter().compile(template)
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        ("foo", "foo"),
+        ("<info>foo</info> <fg=red;options=bold>bar</>", "foo bar"),
+        ("<unknown>foo</unknown> <fg>bar</>", "<unknown>foo <fg>bar"),
+        ("\\<info>foo\\</info> <a@b.c>", "<info>foo</info> <a@b.c>"),
+        ("\x1b[34mfoo\x1b[39m", "foo"),
+        ("foo\0\0", "foo\\\\"),
+    ],
+)
+def test_remove_format(text: str, expected: str) -> None:
+    formatter = Formatter(True)
+
+    assert formatter.remove_format(text) == expected
+
+
+def test_remove_format_does_not_change_style_stack() -> None:
+    formatter = Formatter(True)
+    formatter.format("<info>")
+
+    assert formatter.remove_format("</info><error>foo") == "foo"
+    assert formatter.format("foo") == "\x1b[34mfoo\x1b[39m"
+
+
+@pytest.fixture()
+def inline_styles_cache() -> Iterator[None]:
+    info = Formatter.inline_styles_cache_info()
+    Formatter.clear_inline_styles_cache()
+
+    yield
+
+    Formatter.clear_inline_styles_cache()
+    Formatter.set_inline_styles_cache_size(info.max_size)
+
+
+def test_inline_styles_cache_is_bounded(inline_styles_cache: None) -> None:
+    formatter = Formatter(True)
+    Formatter.set_inline_styles_cache_size(2)
+
+    formatter.format("<fg=red>foo</> <fg=blue>bar</>")
+    formatter.format("<fg=red>foo</> <fg=green>bar</>")
+
+    assert Formatter.inline_styles_cache_info() == CacheInfo(1, 3, 2, 2)
+    assert formatter.format("<fg=blue>foo</>") == "\x1b[34mfoo\x1b[39m"
+    assert Formatter.inline_styles_cache_info() == CacheInfo(1, 4, 2, 2)
+
+    Formatter.set_inline_styles_cache_size(0)
+
+    assert formatter.format("<fg=blue>foo</>") == "\x1b[34mfoo\x1b[39m"
+    assert Formatter.inline_styles_cache_info() == CacheInfo(1, 5, 0, 0)
+
+
+@pytest.mark.parametrize("cache_size", [0, 16])
+def test_format_from_many_threads(cache_size: int) -> None:
+    formatter = Formatter(True, cache_size=cache_size)
+    messages = {
+        f"<{tag}>foo <b>{i}</b> bar</{tag}>": formatter.format(
+            f"<{tag}>foo <b>{i}</b> bar</{tag}>"
+        )
+        for i, tag in enumerate(["info", "error", "comment", "question"])
+    }
+    barrier = threading.Barrier(len(messages) + 1)
+    errors: list[str] = []
+
+    def format_messages(message: str, expected: str) -> None:
+        barrier.wait()
+        for _ in range(2000):
+            if formatter.format(message) != expected:
+                errors.append(message)
+            if formatter.remove_format(message) != formatter.remove_format(expected):
+                errors.append(message)
+
+    def format_unclosed_tags() -> None:
+        barrier.wait()
+        for _ in range(2000):
+            formatter.format("<error>")
+            formatter.format("</error>")
+
+    threads = [
+        threading.Thread(target=format_messages, args=item) for item in messages.items()
+    ]
+    threads.append(threading.Thread(target=format_unclosed_tags))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert formatter.is_decorated()
+
+
+def test_copy() -> None:
+    formatter = Formatter(True, cache_size=8)
+    formatter.set_style("foo", Style("red"))
+    formatter.format("<foo>foo")
+
+    copied = copy.deepcopy(formatter)
+    copied.set_style("foo", Style("blue"))
+
+    assert copied.format("<foo>foo</foo>") == "\x1b[34mfoo\x1b[39m"
+    assert formatter.format("<foo>foo</foo>") == "\x1b[31mfoo\x1b[39m"
+    assert copy.copy(formatter).format("<info>foo</info>") == "\x1b[34mfoo\x1b[39m"
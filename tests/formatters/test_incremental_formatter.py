@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from cleo.formatters.formatter import Formatter
+
+
+@pytest.mark.parametrize(
+    ["chunks", "expected"],
+    [
+        (["foo <in", "fo>bar</", "info> baz"], ["foo ", "\x1b[34mbar\x1b[39m", " baz"]),
+        (["<", "info", ">foo"], ["", "", "\x1b[34mfoo\x1b[39m"]),
+        (["foo\\", "<info>bar"], ["foo", "<info>bar"]),
+        (["foo < bar", " > baz"], ["foo < bar", " > baz"]),
+        (["<info>foo", " bar"], ["\x1b[34mfoo\x1b[39m", "\x1b[34m bar\x1b[39m"]),
+    ],
+)
+def test_feed(chunks: list[str], expected: list[str]) -> None:
+    formatter = Formatter(True).incremental()
+
+    assert [formatter.feed(chunk) for chunk in chunks] == expected
+    assert formatter.flush() == ""
+
+
+def test_flush() -> None:
+    formatter = Formatter(True).incremental()
+
+    assert formatter.feed("<info>foo</inf") == "\x1b[34mfoo\x1b[39m"
+    assert formatter.flush() == "\x1b[34m</inf\x1b[39m"
+    assert formatter.feed("foo\\") == "foo"
+    assert formatter.flush() == "\\"
+    assert formatter.feed("foo") == "foo"
+
+
+def test_feed_long_partial_tag() -> None:
+    formatter = Formatter().incremental()
+    text = "<" + "a" * formatter.MAX_TAG_LENGTH
+
+    assert formatter.feed(text[:-1]) == ""
+    assert formatter.feed(text[-1]) == text
+
+
+def test_feed_does_not_change_formatter_state() -> None:
+    formatter = Formatter(True)
+    incremental_formatter = formatter.incremental(decorated=False)
+
+    assert incremental_formatter.feed("<info>foo") == "foo"
+    assert formatter.format("foo") == "foo"
+
+
+def test_feed_many_chunks() -> None:
+    formatter = Formatter(False).incremental()
+    message = "<info>foo</info> \\<bar> " * 10_000
+
+    output = [formatter.feed(message[i : i + 7]) for i in range(0, len(message), 7)]
+    output.append(formatter.flush())
+
+    assert "".join(output) == Formatter(False).format(message)
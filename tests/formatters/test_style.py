@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from cleo.formatters.style import Style
+
+
+def test_key_follows_changes() -> None:
+    style = Style("red")
+
+    assert style.key == Style("red").key
+    assert style.key != Style("blue").key
+
+    style.foreground("blue").bold()
+
+    assert style.key == Style("blue", options=["bold"]).key
+    assert style.apply("foo") == "\033[34;1mfoo\033[39;22m"
+
+    style.bold(False)
+
+    assert style.key == Style("blue").key
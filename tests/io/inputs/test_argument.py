@@ -60,3 +60,14 @@ def test_list_arguments_do_not_support_non_list_default_values() -> None:
             description="Foo description",
             default="bar",
         )
+
+
+def test_only_list_arguments_support_response_files() -> None:
+    assert Argument("foo", is_list=True, response_files=True).accepts_response_files()
+    assert not Argument("foo", is_list=True).accepts_response_files()
+
+    with pytest.raises(
+        CleoLogicError,
+        match="Only list arguments can have values read from response files",
+    ):
+        Argument("foo", response_files=True)
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import sys
 
+from io import StringIO
 from typing import TYPE_CHECKING
 
 import pytest
 
+from cleo.exceptions import CleoRuntimeError
 from cleo.io.inputs.argument import Argument
 from cleo.io.inputs.argv_input import ArgvInput
 from cleo.io.inputs.definition import Definition
@@ -14,6 +16,7 @@ from cleo.io.inputs.option import Option
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from pathlib import Path
 
 
 @pytest.fixture()
@@ -151,3 +154,151 @@ def test_parse_options(
     i.bind(Definition(options))
 
     assert i.options == expected_options
+
+
+def test_parse_many_tokens() -> None:
+    paths = [f"src/file{i}.py" for i in range(100_000)]
+    args = ["cli.py", "run"]
+    for n, path in enumerate(paths):
+        if n % 1000 == 0:
+            args += ["--exclude", path]
+        else:
+            args.append(path)
+
+    i = ArgvInput(args)
+    i.bind(
+        Definition(
+            [
+                Argument("command"),
+                Argument("paths", is_list=True),
+                Option("--exclude", "-e", flag=False, is_list=True),
+            ]
+        )
+    )
+
+    assert i.argument("command") == "run"
+    assert i.argument("paths") == [p for n, p in enumerate(paths) if n % 1000]
+    assert i.option("exclude") == paths[::1000]
+
+
+def test_bind_to_successive_definitions() -> None:
+    i = ArgvInput(["cli.py", "foo", "-v", "bar", "baz", "--", "-qux"])
+
+    i.bind(
+        Definition(
+            [
+                Argument("command"),
+                Argument("names", is_list=True),
+                Option("--verbose", "-v"),
+            ]
+        )
+    )
+    assert i.arguments == {"command": "foo", "names": ["bar", "baz", "-qux"]}
+    assert i.options == {"verbose": True}
+
+    i.bind(
+        Definition(
+            [
+                Argument("command"),
+                Argument("names", is_list=True),
+                Option("--verbose", "-v", flag=False, requires_value=False),
+            ]
+        )
+    )
+    assert i.arguments == {"command": "foo", "names": ["baz", "-qux"]}
+    assert i.options == {"verbose": "bar"}
+
+
+@pytest.mark.parametrize(
+    ["args", "values", "only_params", "expected"],
+    [
+        (["cli.py", "-vv"], "-v", False, True),
+        (["cli.py", "--foo=bar"], "--foo", False, True),
+        (["cli.py", "--foobar"], "--foo", False, False),
+        (["cli.py", "foo", "-n"], ["--no-interaction", "-n"], False, True),
+        (["cli.py", "--", "-n"], ["--no-interaction", "-n"], False, True),
+        (["cli.py", "--", "-n"], ["--no-interaction", "-n"], True, False),
+        (["cli.py", "--", "--"], "--", False, True),
+        (["cli.py", "--"], "--", True, False),
+    ],
+)
+def test_has_parameter_option(
+    args: list[str], values: str | list[str], only_params: bool, expected: bool
+) -> None:
+    assert ArgvInput(args).has_parameter_option(values, only_params) is expected
+
+
+@pytest.mark.parametrize(
+    ["args", "values", "only_params", "expected"],
+    [
+        (["cli.py", "--foo", "bar"], "--foo", False, "bar"),
+        (["cli.py", "--foo=bar"], "--foo", False, "bar"),
+        (["cli.py", "-fbar"], ["--foo", "-f"], False, "bar"),
+        (["cli.py", "-f", "bar", "--foo=baz"], ["--foo", "-f"], False, "bar"),
+        (["cli.py", "--foo"], "--foo", False, None),
+        (["cli.py", "-fbar", "-fbaz"], "-fba", False, "r"),
+        (["cli.py", "-f" + "o" * 100_000], "-fo", False, "o" * 99_999),
+        (["cli.py", "--", "--foo=bar"], "--foo", False, "bar"),
+        (["cli.py", "--", "--foo=bar"], "--foo", True, "default"),
+        (["cli.py", "bar"], "--foo", False, "default"),
+    ],
+)
+def test_parameter_option(
+    args: list[str], values: str | list[str], only_params: bool, expected: str | None
+) -> None:
+    i = ArgvInput(args)
+
+    assert i.parameter_option(values, "default", only_params) == expected
+
+
+def test_parse_response_files(tmp_path: Path) -> None:
+    response_file = tmp_path / "paths.txt"
+    response_file.write_text("foo.py\r\n\nbar baz.py\n", encoding="utf-8")
+
+    i = ArgvInput(["cli.py", "run", "first.py", f"@{response_file}", "@@last.py"])
+    i.bind(
+        Definition(
+            [
+                Argument("command"),
+                Argument("paths", is_list=True, response_files=True),
+            ]
+        )
+    )
+
+    assert list(i.argument("paths")) == [
+        "first.py",
+        "foo.py",
+        "bar baz.py",
+        "@last.py",
+    ]
+    # The file is read again on each iteration
+    assert list(i.argument("paths")) == list(i.argument("paths"))
+
+
+def test_parse_response_file_from_stream() -> None:
+    i = ArgvInput(["cli.py", "@-"])
+    i.set_stream(StringIO("foo.py\nbar.py\n"))
+    i.bind(Definition([Argument("paths", is_list=True, response_files=True)]))
+
+    paths = i.argument("paths")
+    values = iter(paths)
+
+    assert next(values) == "foo.py"
+    # The stream is only read once
+    assert list(paths) == ["foo.py", "bar.py"]
+    assert list(paths) == ["foo.py", "bar.py"]
+    assert list(values) == ["bar.py"]
+
+
+def test_parse_missing_response_file(tmp_path: Path) -> None:
+    i = ArgvInput(["cli.py", f"@{tmp_path / 'missing.txt'}"])
+
+    with pytest.raises(CleoRuntimeError, match=r'missing\.txt" does not exist'):
+        i.bind(Definition([Argument("paths", is_list=True, response_files=True)]))
+
+
+def test_response_files_are_only_read_when_enabled() -> None:
+    i = ArgvInput(["cli.py", "@paths.txt"])
+    i.bind(Definition([Argument("paths", is_list=True)]))
+
+    assert i.argument("paths") == ["@paths.txt"]
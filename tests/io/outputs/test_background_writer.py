@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import io
+import threading
+
+from functools import partial
+from io import BytesIO
+from io import StringIO
+
+import pytest
+
+from cleo.io.outputs.background_writer import BackgroundWriter
+from cleo.io.outputs.stream_output import FlushPolicy
+from cleo.io.outputs.stream_output import StreamOutput
+
+
+class SlowStream(StringIO):
+    def __init__(self, writes: list[str], event: threading.Event) -> None:
+        super().__init__()
+
+        self._writes = writes
+        self._event = event
+
+    def write(self, s: str) -> int:
+        self._event.wait()
+        self._writes.append(s)
+
+        return super().write(s)
+
+
+def test_outputs_keep_the_order_of_writes() -> None:
+    writes: list[str] = []
+    event = threading.Event()
+    writer = BackgroundWriter()
+    output = StreamOutput(SlowStream(writes, event), writer=writer)
+    error_output = StreamOutput(SlowStream(writes, event), writer=writer)
+
+    for i in range(100):
+        output.write_line(f"foo {i}")
+        error_output.write_line(f"bar {i}")
+
+    assert writes == []
+
+    event.set()
+    output.flush()
+
+    assert writes == [line for i in range(100) for line in (f"foo {i}\n", f"bar {i}\n")]
+
+    writer.close()
+
+
+@pytest.mark.parametrize("flush_policy", list(FlushPolicy))
+def test_flush_policy(flush_policy: FlushPolicy) -> None:
+    writer = BackgroundWriter()
+    stream = StringIO()
+    output = StreamOutput(
+        stream, flush_policy=flush_policy, flush_interval=0, writer=writer
+    )
+
+    output.write_line(["foo", "bar"])
+    output.flush()
+    writer.close()
+
+    assert stream.getvalue() == "foo\nbar\n"
+
+
+def test_submit_blocks_when_the_queue_is_full() -> None:
+    writes: list[str] = []
+    event = threading.Event()
+    writer = BackgroundWriter(max_size=1)
+    output = StreamOutput(SlowStream(writes, event), writer=writer)
+
+    def write() -> None:
+        for message in ["foo", "bar", "baz"]:
+            output.write_line(message)
+
+    thread = threading.Thread(target=write)
+
+    thread.start()
+    thread.join(0.1)
+
+    assert thread.is_alive()
+
+    event.set()
+    thread.join()
+    writer.close()
+
+    assert writes == ["foo\n", "bar\n", "baz\n"]
+
+
+def test_errors_are_raised_by_the_next_call() -> None:
+    writer = BackgroundWriter()
+    stream = StringIO()
+    output = StreamOutput(stream, writer=writer)
+    stream.close()
+
+    output.write_line("foo")
+
+    with pytest.raises(ValueError):
+        writer.drain()
+
+    writer.close()
+
+
+def test_write_bytes() -> None:
+    buffer = BytesIO()
+    writer = BackgroundWriter()
+    output = StreamOutput(io.TextIOWrapper(buffer, encoding="utf-8"), writer=writer)
+
+    output.write("foo ")
+    output.write_bytes(b"bar\n")
+    output.copy_from(BytesIO(b"baz\n"))
+    output.flush()
+    writer.close()
+
+    assert buffer.getvalue() == b"foo bar\nbaz\n"
+
+
+def test_close_stops_the_thread() -> None:
+    writer = BackgroundWriter()
+    stream = StringIO()
+    output = StreamOutput(stream, writer=writer)
+
+    output.write_line("foo")
+    writer.close()
+    output.write_line("bar")
+    writer.close()
+
+    assert stream.getvalue() == "foo\nbar\n"
+    assert not any(
+        thread.name == "cleo-background-writer" for thread in threading.enumerate()
+    )
+
+
+def test_close_while_writing_from_other_threads() -> None:
+    writes: list[tuple[int, int]] = []
+    writer = BackgroundWriter(max_size=8)
+
+    def submit(n: int) -> None:
+        for i in range(1000):
+            writer.submit(partial(writes.append, (n, i)))
+
+    threads = [threading.Thread(target=submit, args=(n,)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+
+    while any(thread.is_alive() for thread in threads):
+        writer.close()
+
+    writer.close()
+
+    for n in range(2):
+        assert [i for m, i in writes if m == n] == list(range(1000))
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+
+from io import BytesIO
 from io import StringIO
 
 import pytest
@@ -36,6 +39,15 @@ def test_clear_all(output: SectionOutput, stream: StringIO) -> None:
     assert stream.read() == "Foo\nBar\n\x1b[2A\x1b[0J"
 
 
+def test_clear_multiple_messages(output: SectionOutput, stream: StringIO) -> None:
+    output.write_line(["Foo", "Bar"])
+    output.write(["Baz", "FooBar"])
+    output.clear(3)
+
+    assert output.lines == 1
+    assert stream.getvalue() == "Foo\nBar\nBaz\nFooBar\n\x1b[3A\x1b[0J"
+
+
 def test_clear_with_number_of_lines(output: SectionOutput, stream: StringIO) -> None:
     output.write_line("Foo\nBar\nBaz\nFooBar")
     output.clear(2)
@@ -109,3 +121,25 @@ def test_multiple_sections_output(
         stream.read()
         == "Foo\nBar\n\x1b[2A\x1b[0JBar\n\x1b[1A\x1b[0JBaz\nBar\n\x1b[1A\x1b[0JFoobar\n"
     )
+
+
+def test_clear_wide_characters(
+    stream: StringIO, sections: list[SectionOutput], environ: None
+) -> None:
+    os.environ.update({"COLUMNS": "10", "LINES": "25"})
+    output = SectionOutput(stream, sections, decorated=True)
+
+    output.write_line("日本語のテキスト")
+    output.clear()
+
+    assert stream.getvalue() == "日本語のテキスト\n\x1b[2A\x1b[0J"
+
+
+def test_copy_from(output: SectionOutput, stream: StringIO) -> None:
+    output.COPY_BUFFER_SIZE = 3
+
+    assert output.copy_from(BytesIO("Foo\nBär\n\nBaz".encode())) == 13
+    output.clear()
+
+    assert output.lines == 0
+    assert stream.getvalue() == "Foo\nBär\n\nBaz\n\x1b[4A\x1b[0J"
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import io
 import os
+import threading
 
+from functools import partial
+from io import BytesIO
 from io import StringIO
+from typing import TYPE_CHECKING
 
 import pytest
 
+from cleo.io.outputs.output import Type
+from cleo.io.outputs.output import Verbosity
+from cleo.io.outputs.stream_output import FlushPolicy
 from cleo.io.outputs.stream_output import StreamOutput
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
 @pytest.fixture()
 def stream() -> StringIO:
     return StringIO()
@@ -33,3 +48,216 @@ def test_is_decorated_respects_environment(
     assert output.is_decorated() == is_decorated
     expected = "\x1b[34mFooBar\x1b[39m\n" if is_decorated else "FooBar\n"
     assert stream.read() == expected
+
+
+@pytest.mark.parametrize(
+    ["decorated", "type", "expected"],
+    [
+        (True, Type.NORMAL, "\x1b[34m<foo>\x1b[39m 1\n"),
+        (False, Type.NORMAL, "<foo> 1\n"),
+        (True, Type.PLAIN, " 1\n"),
+        (True, Type.RAW, "<info><foo></info> 1\n"),
+    ],
+)
+def test_write_compiled_template(
+    stream: StringIO, decorated: bool, type: Type, expected: str
+) -> None:
+    output = StreamOutput(stream, decorated=decorated)
+    template = output.formatter.compile("<info>{}</info> {}")
+
+    output.write_line(template.render("<foo>", 1), type=type)
+
+    assert stream.getvalue() == expected
+
+
+def test_write_plain_on_decorated_output(stream: StringIO) -> None:
+    output = StreamOutput(stream, decorated=True)
+
+    output.write_line("<info>foo</info> <fg=red;options=bold>bar</>", type=Type.PLAIN)
+
+    assert stream.getvalue() == "foo bar\n"
+
+
+@pytest.mark.parametrize(
+    ["flush_policy", "flushes"],
+    [
+        (FlushPolicy.ALWAYS, 3),
+        (FlushPolicy.LINE, 2),
+        (FlushPolicy.INTERVAL, 0),
+        (FlushPolicy.EXPLICIT, 0),
+    ],
+)
+def test_flush_policy(
+    stream: StringIO, mocker: MockerFixture, flush_policy: FlushPolicy, flushes: int
+) -> None:
+    flush = mocker.spy(stream, "flush")
+    output = StreamOutput(stream, flush_policy=flush_policy, flush_interval=60)
+
+    output.write("foo")
+    output.write_line("bar")
+    output.write_line("baz")
+
+    assert flush.call_count == flushes
+    assert stream.getvalue() == "foobar\nbaz\n"
+
+    output.flush()
+
+    assert flush.call_count == flushes + 1
+
+
+def test_flush_policy_interval(stream: StringIO, mocker: MockerFixture) -> None:
+    flush = mocker.spy(stream, "flush")
+    output = StreamOutput(stream, flush_policy=FlushPolicy.INTERVAL, flush_interval=0)
+
+    output.write_line("foo")
+    output.write_line("bar")
+
+    assert flush.call_count == 2
+
+
+def test_flush_policy_interval_after_a_pause(
+    stream: StringIO, mocker: MockerFixture
+) -> None:
+    flushed = threading.Event()
+    mocker.patch.object(stream, "flush", side_effect=flushed.set)
+    output = StreamOutput(stream, flush_policy=FlushPolicy.INTERVAL, flush_interval=1)
+
+    output.write_line("foo")
+
+    assert not flushed.is_set()
+    assert flushed.wait(5)
+
+
+def test_default_flush_policy(stream: StringIO, mocker: MockerFixture) -> None:
+    assert StreamOutput(stream).flush_policy is FlushPolicy.INTERVAL
+
+    mocker.patch("os.isatty", return_value=True)
+    mocker.patch.object(stream, "fileno", return_value=1)
+
+    output = StreamOutput(stream)
+
+    assert output.flush_policy is FlushPolicy.ALWAYS
+    assert output.section().flush_policy is FlushPolicy.ALWAYS
+
+
+@pytest.mark.parametrize("flush_policy", list(FlushPolicy))
+def test_write_bytes(flush_policy: FlushPolicy) -> None:
+    buffer = BytesIO()
+    stream = io.TextIOWrapper(buffer, encoding="utf-8")
+    output = StreamOutput(stream, flush_policy=flush_policy)
+
+    output.write("foo ")
+    output.write_bytes(b"\xffbar\n")
+    output.write_bytes(b"baz", verbosity=Verbosity.VERBOSE)
+    output.write_line("<info>baz</info>")
+    output.flush()
+
+    assert buffer.getvalue() == b"foo \xffbar\nbaz\n"
+
+
+def test_write_bytes_to_text_stream(stream: StringIO) -> None:
+    output = StreamOutput(stream)
+
+    output.write_bytes("föo\n".encode())
+
+    assert stream.getvalue() == "föo\n"
+
+
+def test_copy_from(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.write_bytes(b"foo\n" + bytes(range(256)) * 1024)
+    target = tmp_path / "target"
+
+    with source.open("rb") as file, target.open("w") as stream:
+        output = StreamOutput(stream)
+        output.write("bar ")
+        assert file.read(4) == b"foo\n"
+
+        assert output.copy_from(file) == 256 * 1024
+        assert file.read() == b""
+
+        output.write("baz")
+
+    assert target.read_bytes() == b"bar " + bytes(range(256)) * 1024 + b"baz"
+
+
+def test_copy_from_file_object() -> None:
+    buffer = BytesIO()
+    stream = io.TextIOWrapper(buffer, encoding="utf-8")
+    output = StreamOutput(stream)
+    output.COPY_BUFFER_SIZE = 3
+
+    assert output.copy_from(BytesIO(b"foo bar")) == 7
+    assert output.copy_from(BytesIO(b"baz"), verbosity=Verbosity.VERBOSE) == 0
+
+    output.flush()
+
+    assert buffer.getvalue() == b"foo bar"
+
+
+def test_copy_from_to_text_stream(stream: StringIO) -> None:
+    output = StreamOutput(stream)
+    output.COPY_BUFFER_SIZE = 3
+
+    assert output.copy_from(BytesIO("aéb€\xff".encode() + b"\xff")) == 10
+
+    assert stream.getvalue() == "aéb€ÿ\ufffd"
+
+
+def test_write_lazy_messages(stream: StringIO) -> None:
+    output = StreamOutput(stream, verbosity=Verbosity.VERBOSE)
+    calls: list[Verbosity] = []
+
+    def message(verbosity: Verbosity) -> str:
+        calls.append(verbosity)
+
+        return f"<info>{verbosity.name}</info>"
+
+    for verbosity in Verbosity:
+        output.write_line(partial(message, verbosity), verbosity=verbosity)
+
+    output.write(lambda: ["foo ", "bar"], verbosity=Verbosity.VERBOSE)
+
+    assert calls == [Verbosity.QUIET, Verbosity.NORMAL, Verbosity.VERBOSE]
+    assert stream.getvalue() == "QUIET\nNORMAL\nVERBOSE\nfoo bar"
+
+
+def test_write_does_not_iterate_skipped_messages(stream: StringIO) -> None:
+    output = StreamOutput(stream, verbosity=Verbosity.QUIET)
+    messages = iter(["foo", "bar"])
+
+    output.write_line(messages)
+
+    assert next(messages) == "foo"
+
+
+def test_write_does_not_evaluate_skipped_messages(stream: StringIO) -> None:
+    output = StreamOutput(stream)
+
+    def message() -> str:
+        raise AssertionError("Skipped messages must not be evaluated")
+
+    def messages() -> Iterator[str]:
+        raise AssertionError("Skipped messages must not be iterated")
+        yield ""
+
+    for _ in range(100_000):
+        output.write_line(message, verbosity=Verbosity.DEBUG)
+        output.write_line(messages(), verbosity=Verbosity.VERBOSE)
+        output.write(lambda: messages(), verbosity=Verbosity.VERY_VERBOSE)
+
+    assert stream.getvalue() == ""
+
+
+def test_write_messages_in_batches(stream: StringIO, mocker: MockerFixture) -> None:
+    output = StreamOutput(stream, flush_policy=FlushPolicy.ALWAYS)
+    output.WRITE_BUFFER_SIZE = 10
+    write = mocker.spy(stream, "write")
+    flush = mocker.spy(stream, "flush")
+
+    output.write_line(f"<info>foo {i}</info>" for i in range(10))
+    output.write(["foo", "bar"])
+
+    assert write.call_count == 6
+    assert flush.call_count == 6
+    assert stream.getvalue() == "".join(f"foo {i}\n" for i in range(10)) + "foobar"
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import date
+from io import BytesIO
+from io import TextIOWrapper
+from typing import TYPE_CHECKING
+
+from cleo.io.buffered_io import BufferedIO
+from cleo.io.inputs.string_input import StringInput
+from cleo.io.io import IO
+from cleo.io.io import RecordFormat
+from cleo.io.outputs.background_writer import BackgroundWriter
+from cleo.io.outputs.buffered_output import BufferedOutput
+from cleo.io.outputs.output import Verbosity
+from cleo.io.outputs.stream_output import StreamOutput
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_emit_text() -> None:
+    io = BufferedIO()
+
+    io.emit({"name": "<info>foo</info>", "released": date(2024, 1, 1)})
+    io.emit({"name": "bar", "released": None})
+
+    assert io.fetch_output() == (
+        " name     <info>foo</info> \n"
+        " released 2024-01-01       \n"
+        "\n"
+        " name     bar \n"
+        " released     \n"
+    )
+
+
+def test_emit_json() -> None:
+    io = BufferedIO(decorated=True)
+    io.set_record_format(RecordFormat.JSON)
+
+    io.emit({"name": "<info>foo</info>", "released": date(2024, 1, 1)})
+    io.emit({"name": "bär", "tags": ["a", "b"]})
+    io.emit({"name": "baz"}, verbosity=Verbosity.VERBOSE)
+
+    assert io.fetch_output() == (
+        '{"name": "<info>foo</info>", "released": "2024-01-01"}\n'
+        '{"name": "bär", "tags": ["a", "b"]}\n'
+    )
+
+
+def test_with_input_keeps_record_format() -> None:
+    io = IO(StringInput(""), BufferedOutput(), BufferedOutput())
+    io.set_record_format(RecordFormat.JSON)
+
+    assert io.with_input(StringInput("")).record_format is RecordFormat.JSON
+
+
+def test_write_error_keeps_the_order_of_outputs() -> None:
+    # Both outputs write to the same file, like with 2>&1
+    buffer = BytesIO()
+    output = StreamOutput(TextIOWrapper(buffer, encoding="utf-8"))
+    # sys.stderr is line buffered
+    error_output = StreamOutput(
+        TextIOWrapper(buffer, encoding="utf-8", line_buffering=True)
+    )
+    cleo_io = IO(StringInput(""), output, error_output)
+
+    cleo_io.write("foo ")
+    cleo_io.write_error_line("bar")
+    cleo_io.write("baz ")
+    cleo_io.write_error_bytes(b"qux\n")
+
+    assert buffer.getvalue() == b"foo bar\nbaz qux\n"
+
+
+def test_write_error_does_not_flush_the_output_for_skipped_messages(
+    mocker: MockerFixture,
+) -> None:
+    output = BufferedOutput()
+    cleo_io = IO(StringInput(""), output, BufferedOutput())
+    flush = mocker.spy(output, "flush")
+
+    cleo_io.write_error_line("foo", verbosity=Verbosity.DEBUG)
+
+    assert flush.call_count == 0
+
+    cleo_io.write_error_line("foo")
+
+    assert flush.call_count == 1
+
+
+def test_write_error_with_shared_writer(mocker: MockerFixture) -> None:
+    buffer = BytesIO()
+    writer = BackgroundWriter()
+    output = StreamOutput(TextIOWrapper(buffer, encoding="utf-8"), writer=writer)
+    error_output = StreamOutput(
+        TextIOWrapper(buffer, encoding="utf-8", line_buffering=True), writer=writer
+    )
+    cleo_io = IO(StringInput(""), output, error_output)
+    drain = mocker.spy(writer, "drain")
+
+    cleo_io.write("foo ")
+    cleo_io.write_error_line("bar")
+    writer.close()
+
+    assert drain.call_count == 0
+    assert buffer.getvalue() == b"foo bar\n"
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.application import Application
+from cleo.exceptions import CleoCommandNotFoundError
+from cleo.loaders.cached_command_loader import CachedCommandLoader
+from cleo.loaders.cached_command_loader import default_cache_dir
+from cleo.loaders.factory_command_loader import FactoryCommandLoader
+from cleo.testers.application_tester import ApplicationTester
+from tests.fixtures.foo1_command import Foo1Command
+from tests.fixtures.foo_command import FooCommand
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.commands.command import Command
+
+
+@pytest.fixture()
+def loaded() -> list[str]:
+    return []
+
+
+@pytest.fixture()
+def factories(loaded: list[str]) -> FactoryCommandLoader:
+    def foo() -> Command:
+        loaded.append("foo bar")
+        return FooCommand()
+
+    def foo1() -> Command:
+        loaded.append("foo bar1")
+        return Foo1Command()
+
+    return FactoryCommandLoader({"foo bar": foo, "foo bar1": foo1})
+
+
+def test_metadata_builds_and_reuses_cache(
+    tmp_path: Path, factories: FactoryCommandLoader, loaded: list[str]
+) -> None:
+    path = tmp_path / "commands.json"
+    loader = CachedCommandLoader(factories, path, version="1.0")
+
+    metadata = loader.metadata("foo bar")
+
+    assert metadata is not None
+    assert metadata.description == "The foo bar command"
+    assert metadata.aliases == ["afoobar"]
+    assert loaded == ["foo bar", "foo bar1"]
+    assert path.exists()
+
+    loaded.clear()
+    loader = CachedCommandLoader(factories, path, version="1.0")
+    metadata = loader.metadata("foo bar1")
+
+    assert metadata is not None
+    assert metadata.description == "The foo bar1 command"
+    assert loaded == []
+
+
+def test_cache_is_invalidated_by_version(
+    tmp_path: Path, factories: FactoryCommandLoader, loaded: list[str]
+) -> None:
+    path = tmp_path / "commands.json"
+    CachedCommandLoader(factories, path, version="1.0").metadata("foo bar")
+    loaded.clear()
+
+    CachedCommandLoader(factories, path, version="1.1").metadata("foo bar")
+
+    assert loaded == ["foo bar", "foo bar1"]
+
+
+def test_cache_is_invalidated_by_modified_sources(
+    tmp_path: Path, factories: FactoryCommandLoader, loaded: list[str]
+) -> None:
+    path = tmp_path / "commands.json"
+    CachedCommandLoader(factories, path).metadata("foo bar")
+    loaded.clear()
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["sources"]
+    for signature in data["sources"].values():
+        signature[0] -= 1
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    CachedCommandLoader(factories, path).metadata("foo bar")
+
+    assert loaded == ["foo bar", "foo bar1"]
+
+
+def test_corrupted_cache_is_rebuilt(
+    tmp_path: Path, factories: FactoryCommandLoader, loaded: list[str]
+) -> None:
+    path = tmp_path / "commands.json"
+    path.write_text("{", encoding="utf-8")
+
+    loader = CachedCommandLoader(factories, path)
+
+    assert loader.metadata("foo bar") is not None
+    assert json.loads(path.read_text(encoding="utf-8"))["commands"]
+
+
+def test_metadata_of_unknown_command_raises_error(
+    tmp_path: Path, factories: FactoryCommandLoader
+) -> None:
+    loader = CachedCommandLoader(factories, tmp_path / "commands.json")
+
+    with pytest.raises(CleoCommandNotFoundError):
+        loader.metadata("baz")
+
+
+def test_application_lists_commands_from_cache(
+    tmp_path: Path, factories: FactoryCommandLoader, loaded: list[str]
+) -> None:
+    path = tmp_path / "commands.json"
+    CachedCommandLoader(factories, path).metadata("foo bar")
+    loaded.clear()
+
+    app = Application()
+    app.auto_exits(False)
+    app.set_command_loader(CachedCommandLoader(factories, path))
+    tester = ApplicationTester(app)
+
+    tester.execute("list", decorated=False)
+
+    assert "foo bar1" in tester.io.fetch_output()
+    assert loaded == []
+
+
+def test_default_cache_dir(environ: None, tmp_path: Path) -> None:
+    os.environ["XDG_CACHE_HOME"] = str(tmp_path)
+    os.environ["LOCALAPPDATA"] = str(tmp_path)
+
+    assert default_cache_dir("myapp") == tmp_path / "myapp"
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import sys
+
+from importlib.metadata import EntryPoint
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.application import Application
+from cleo.exceptions import CleoCommandNotFoundError
+from cleo.loaders.entry_point_command_loader import EntryPointCommandLoader
+from tests.fixtures.foo1_command import Foo1Command
+from tests.fixtures.foo_command import FooCommand
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+
+GROUP = "cleo.test.commands"
+
+
+@pytest.fixture()
+def entry_points(mocker: MockerFixture) -> MagicMock:
+    eps = [
+        EntryPoint("foo bar", "tests.fixtures.foo_command:FooCommand", GROUP),
+        EntryPoint("foo bar1", "tests.fixtures.foo1_command:Foo1Command", GROUP),
+        EntryPoint("foo bar", "tests.fixtures.foo1_command:Foo1Command", GROUP),
+    ]
+
+    if sys.version_info >= (3, 10):
+        return mocker.patch("importlib.metadata.entry_points", return_value=eps)
+
+    return mocker.patch("importlib.metadata.entry_points", return_value={GROUP: eps})
+
+
+def test_names(entry_points: MagicMock) -> None:
+    loader = EntryPointCommandLoader(GROUP)
+
+    assert loader.names == ["foo bar", "foo bar1"]
+    assert loader.has("foo bar")
+    assert not loader.has("baz")
+
+
+def test_get(entry_points: MagicMock) -> None:
+    loader = EntryPointCommandLoader(GROUP)
+
+    assert isinstance(loader.get("foo bar"), FooCommand)
+    assert isinstance(loader.get("foo bar1"), Foo1Command)
+
+    with pytest.raises(CleoCommandNotFoundError):
+        loader.get("baz")
+
+
+def test_index_is_reused(entry_points: MagicMock, tmp_path: Path) -> None:
+    path = tmp_path / "index.json"
+
+    assert EntryPointCommandLoader(GROUP, path).names == ["foo bar", "foo bar1"]
+    assert entry_points.call_count == 1
+
+    assert EntryPointCommandLoader(GROUP, path).names == ["foo bar", "foo bar1"]
+    assert entry_points.call_count == 1
+
+
+def test_index_is_invalidated_by_installed_distributions(
+    entry_points: MagicMock, tmp_path: Path
+) -> None:
+    path = tmp_path / "index.json"
+    EntryPointCommandLoader(GROUP, path).has("foo bar")
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["fingerprint"] = "outdated"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert EntryPointCommandLoader(GROUP, path).has("foo bar")
+    assert entry_points.call_count == 2
+
+
+def test_application_runs_entry_point_command(entry_points: MagicMock) -> None:
+    app = Application()
+    app.set_command_loader(EntryPointCommandLoader(GROUP))
+
+    assert isinstance(app.find("foo bar1"), Foo1Command)
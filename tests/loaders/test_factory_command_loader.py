@@ -4,6 +4,7 @@ import pytest
 
 from cleo.commands.command import Command
 from cleo.exceptions import CleoCommandNotFoundError
+from cleo.loaders.command_metadata import CommandMetadata
 from cleo.loaders.factory_command_loader import FactoryCommandLoader
 
 
@@ -48,3 +49,17 @@ def test_names() -> None:
     )
 
     assert loader.names == ["foo", "bar"]
+
+
+def test_metadata() -> None:
+    metadata = CommandMetadata("foo", description="The foo command")
+    loader = FactoryCommandLoader(
+        {"foo": lambda: command("foo"), "bar": lambda: command("bar")},
+        manifest={"foo": metadata},
+    )
+
+    assert loader.metadata("foo") is metadata
+    assert loader.metadata("bar") is None
+
+    with pytest.raises(CleoCommandNotFoundError):
+        loader.metadata("baz")
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from cleo.application import Application
+from cleo.exceptions import CleoCommandNotFoundError
+from cleo.exceptions import CleoValueError
+from cleo.loaders.command_metadata import CommandMetadata
+from cleo.loaders.import_path_command_loader import ImportPathCommandLoader
+from cleo.loaders.import_path_command_loader import import_object
+from tests.fixtures.foo1_command import Foo1Command
+from tests.fixtures.foo_command import FooCommand
+
+
+def test_import_object() -> None:
+    assert import_object("tests.fixtures.foo_command:FooCommand") is FooCommand
+    assert import_object("tests.fixtures.foo_command:FooCommand.name") == "foo bar"
+
+    with pytest.raises(CleoValueError):
+        import_object(":FooCommand")
+
+
+def test_has_and_names() -> None:
+    loader = ImportPathCommandLoader(
+        {"foo bar": "tests.fixtures.foo_command:FooCommand", "baz": "not.a.module:X"}
+    )
+
+    assert loader.names == ["foo bar", "baz"]
+    assert loader.has("foo bar")
+    assert loader.has("baz")
+    assert not loader.has("qux")
+
+
+def test_get() -> None:
+    loader = ImportPathCommandLoader(
+        {
+            "foo bar": "tests.fixtures.foo_command:FooCommand",
+            "foo bar1": "tests.fixtures.foo1_command:Foo1Command",
+        }
+    )
+
+    assert isinstance(loader.get("foo bar"), FooCommand)
+    assert isinstance(loader.get("foo bar1"), Foo1Command)
+    assert loader.get("foo bar") is not loader.get("foo bar")
+
+    with pytest.raises(CleoCommandNotFoundError):
+        loader.get("baz")
+
+
+def test_metadata() -> None:
+    metadata = CommandMetadata("foo bar")
+    loader = ImportPathCommandLoader(
+        {"foo bar": "tests.fixtures.foo_command:FooCommand"},
+        manifest={"foo bar": metadata},
+    )
+
+    assert loader.metadata("foo bar") is metadata
+
+    with pytest.raises(CleoCommandNotFoundError):
+        loader.metadata("baz")
+
+
+def test_unknown_commands_do_not_import_modules() -> None:
+    module = "tests.fixtures.foo_sub_namespaced1_command"
+    sys.modules.pop(module, None)
+
+    app = Application()
+    app.set_command_loader(
+        ImportPathCommandLoader({"foo bar": f"{module}:FooSubNamespaced1Command"})
+    )
+
+    assert not app.has("foo")
+    assert not app.has("foo baz")
+    assert module not in sys.modules
+
+    assert app.has("foo bar")
+    assert module in sys.modules
@@ -3,16 +3,25 @@ from __future__ import annotations
 import os
 import sys
 
+from io import StringIO
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
 from cleo.application import Application
 from cleo.commands.command import Command
+from cleo.descriptors.application_description import ApplicationDescription
 from cleo.exceptions import CleoCommandNotFoundError
 from cleo.exceptions import CleoNamespaceNotFoundError
+from cleo.exceptions import CleoRuntimeError
+from cleo.exceptions import CleoValueError
+from cleo.io.inputs.argv_input import ArgvInput
 from cleo.io.io import IO
+from cleo.io.outputs.stream_output import FlushPolicy
 from cleo.io.outputs.stream_output import StreamOutput
+from cleo.loaders.command_metadata import CommandMetadata
+from cleo.loaders.factory_command_loader import FactoryCommandLoader
 from cleo.testers.application_tester import ApplicationTester
 from tests.fixtures.foo1_command import Foo1Command
 from tests.fixtures.foo2_command import Foo2Command
@@ -21,6 +30,13 @@ from tests.fixtures.foo_command import FooCommand
 from tests.fixtures.foo_sub_namespaced1_command import FooSubNamespaced1Command
 from tests.fixtures.foo_sub_namespaced2_command import FooSubNamespaced2Command
 from tests.fixtures.foo_sub_namespaced3_command import FooSubNamespaced3Command
+from tests.fixtures.records_command import RecordsCommand
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_mock import MockerFixture
 
 
 FIXTURES_PATH = Path(__file__).parent.joinpath("fixtures")
@@ -208,6 +224,23 @@ def test_find_ambiguous_command_hidden(app: Application) -> None:
         app.find("foo b")
 
 
+def test_find_suggests_commands_added_after_failed_lookup(app: Application) -> None:
+    app.set_command_loader(FactoryCommandLoader({"foo bar1": Foo1Command}))
+
+    with pytest.raises(
+        CleoCommandNotFoundError, match=r"Did you mean this\?\n    foo bar1$"
+    ):
+        app.find("foo b")
+
+    app.add(FooCommand())
+
+    with pytest.raises(
+        CleoCommandNotFoundError,
+        match=r"Did you mean one of these\?\n    foo bar1\n    foo bar$",
+    ):
+        app.find("foo b")
+
+
 def test_set_catch_exceptions(app: Application, environ: dict[str, str]) -> None:
     app.auto_exits(False)
     os.environ["COLUMNS"] = "120"
@@ -254,6 +287,109 @@ def test_run(app: Application, argv: list[str]) -> None:
     assert command.io.error_output.stream == sys.stderr
 
 
+def test_run_flushes_outputs(app: Application, mocker: MockerFixture) -> None:
+    app.auto_exits(False)
+    app.add(FooCommand())
+    stream = StringIO()
+    flush = mocker.spy(stream, "flush")
+    output = StreamOutput(stream, flush_policy=FlushPolicy.EXPLICIT)
+
+    assert app.run(ArgvInput(["console", "foo bar"]), output) == 0
+    assert stream.getvalue() == "interact called\ncalled\n"
+    assert flush.call_count == 1
+
+
+def test_run_with_background_output(app: Application, mocker: MockerFixture) -> None:
+    app.auto_exits(False)
+    app.background_output()
+    app.add(FooCommand())
+    stream = StringIO()
+    mocker.patch.object(sys, "stdout", stream)
+
+    assert app.run(ArgvInput(["console", "foo bar"])) == 0
+    assert stream.getvalue() == "interact called\ncalled\n"
+
+
+def test_run_with_structured_output(
+    app: Application, tester: ApplicationTester
+) -> None:
+    app.structured_output()
+    app.add(RecordsCommand())
+
+    assert tester.execute("records") == 0
+    assert tester.io.fetch_output() == (
+        " name    foo \n version 1.0 \n\n name    <bar> \n version       \n"
+    )
+
+    # Records are not formatted
+    assert tester.execute("records --format json", decorated=True) == 0
+    assert tester.io.fetch_output() == (
+        '{"name": "foo", "version": "1.0"}\n{"name": "<bar>", "version": null}\n'
+    )
+
+
+def test_run_with_unsupported_format(
+    app: Application, tester: ApplicationTester
+) -> None:
+    app.structured_output()
+    app.add(RecordsCommand())
+
+    with pytest.raises(CleoValueError):
+        tester.execute("records --format xml")
+
+
+def test_run_with_missing_format(app: Application, tester: ApplicationTester) -> None:
+    app.structured_output()
+    app.add(RecordsCommand())
+
+    with pytest.raises(
+        CleoRuntimeError, match='The "--format" option requires a value'
+    ):
+        tester.execute("records --format")
+
+
+def test_format_option_is_opt_in(app: Application) -> None:
+    assert not app.definition.has_option("format")
+
+    app.structured_output()
+
+    assert app.definition.has_option("format")
+
+
+def test_run_flushes_outputs_when_background_writes_fail(
+    app: Application, mocker: MockerFixture
+) -> None:
+    app.auto_exits(False)
+    app.catch_exceptions(False)
+    app.background_output()
+    app.add(FooCommand())
+    stream = StringIO()
+    mocker.patch.object(stream, "write", side_effect=ValueError)
+    mocker.patch.object(sys, "stdout", stream)
+    output = StreamOutput(StringIO(), flush_policy=FlushPolicy.EXPLICIT)
+    flush = mocker.spy(output, "flush")
+
+    with pytest.raises(ValueError):
+        app.run(ArgvInput(["console", "foo bar"]), error_output=output)
+
+    assert flush.call_count == 1
+
+
+def test_run_with_broken_pipe(app: Application, mocker: MockerFixture) -> None:
+    app.auto_exits(False)
+    app.add(FooCommand())
+    stream = StringIO()
+    mocker.patch.object(stream, "flush", side_effect=BrokenPipeError)
+    mocker.patch("os.open")
+    dup2 = mocker.patch("os.dup2")
+    mocker.patch.object(sys, "stdout", stream)
+    mocker.patch.object(stream, "fileno", return_value=1)
+    output = StreamOutput(stream, flush_policy=FlushPolicy.EXPLICIT)
+
+    assert app.run(ArgvInput(["console", "foo bar"]), output) == 0
+    assert dup2.call_count == 1
+
+
 def test_run_runs_the_list_command_without_arguments(tester: ApplicationTester) -> None:
     tester.execute("", decorated=False)
 
@@ -380,3 +516,119 @@ def test_run_with_input_and_non_interactive(cmd: Command) -> None:
 
     assert status_code == 0
     assert tester.io.fetch_output() == "default input\n"
+
+
+def test_list_reads_command_loader_manifest(app: Application) -> None:
+    loaded: list[str] = []
+
+    def factory() -> Command:
+        loaded.append("foo bar")
+
+        return FooCommand()
+
+    app.set_command_loader(
+        FactoryCommandLoader(
+            {"foo bar": factory},
+            manifest={
+                "foo bar": CommandMetadata(
+                    "foo bar", "The foo bar command", aliases=["afoobar"]
+                )
+            },
+        )
+    )
+    app.auto_exits(False)
+    tester = ApplicationTester(app)
+
+    tester.execute("list", decorated=False)
+
+    assert "foo bar  [afoobar] The foo bar command" in tester.io.fetch_output()
+    assert app.get_namespaces() == ["foo"]
+    assert loaded == []
+
+    tester.execute("foo bar", decorated=False)
+
+    assert tester.io.fetch_output() == "interact called\ncalled\n"
+    assert loaded == ["foo bar"]
+
+
+def test_list_namespace_with_command_loader(app: Application) -> None:
+    app.set_command_loader(FactoryCommandLoader({"foo bar": FooCommand}))
+    app.auto_exits(False)
+    tester = ApplicationTester(app)
+
+    assert tester.execute("list foo", decorated=False) == 0
+    assert "foo bar" in tester.io.fetch_output()
+
+
+def test_application_description_with_command_loader(app: Application) -> None:
+    loaded: list[str] = []
+
+    def factory() -> Command:
+        loaded.append("foo bar")
+
+        return FooCommand()
+
+    app.set_command_loader(
+        FactoryCommandLoader(
+            {"foo bar": factory},
+            manifest={
+                "foo bar": CommandMetadata("foo bar", aliases=["afoobar"]),
+            },
+        )
+    )
+    description = ApplicationDescription(app, namespace="foo")
+
+    assert description.metadata["foo bar"].aliases == ["afoobar"]
+    assert description.command_metadata("foo bar").name == "foo bar"
+    assert loaded == []
+
+    assert isinstance(description.commands["foo bar"], FooCommand)
+    assert isinstance(description.command("foo bar"), FooCommand)
+    assert loaded == ["foo bar"]
+
+
+def test_run_only_loads_the_dispatched_command(app: Application) -> None:
+    loaded: list[str] = []
+
+    def factory(command: type[Command]) -> Callable[[], Command]:
+        def load() -> Command:
+            loaded.append(command.name or "")
+
+            return command()
+
+        return load
+
+    app.set_command_loader(
+        FactoryCommandLoader(
+            {
+                "foo bar": factory(FooCommand),
+                "foo bar1": factory(Foo1Command),
+                "foo": factory(Foo2Command),
+            }
+        )
+    )
+    app.auto_exits(False)
+    tester = ApplicationTester(app)
+
+    tester.execute("foo bar1 --no-interaction")
+
+    assert loaded == ["foo bar1"]
+
+
+def test_find_namespace_with_command_loader(app: Application) -> None:
+    foo = FooCommand()
+    foo.hidden = True
+    app.add(foo)
+    app.set_command_loader(
+        FactoryCommandLoader(
+            {"foo bar1": Foo1Command},
+            manifest={"foo bar1": CommandMetadata("foo bar1", hidden=True)},
+        )
+    )
+
+    with pytest.raises(CleoNamespaceNotFoundError):
+        app.find_namespace("foo")
+
+    app.add(FooSubNamespaced1Command())
+
+    assert app.find_namespace("foo") == "foo"
@@ -60,3 +60,11 @@ def test_degrade_true_colors(
     color = Color(foreground, background, options)
 
     assert color.apply(" ") == expected
+
+
+def test_set_and_unset() -> None:
+    color = Color("red", options=["bold", "underline"])
+
+    assert color.set() == "\033[31;1;4m"
+    assert color.unset() == "\033[39;22;24m"
+    assert Color().set() == Color().unset() == ""
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from cleo._command_index import CommandIndex
+
+
+@pytest.fixture()
+def index() -> CommandIndex:
+    index = CommandIndex()
+    index.add("list")
+    index.add("foo bar")
+    index.add("foo bar baz")
+    index.add("foo qux", hidden=True)
+    index.add("cache clear")
+    index.add("debug info", hidden=None)
+
+    return index
+
+
+def test_contains(index: CommandIndex) -> None:
+    assert "foo bar" in index
+    assert "foo" not in index
+    assert "debug info" in index
+
+
+@pytest.mark.parametrize(
+    ["tokens", "expected"],
+    [
+        (["list"], "list"),
+        (["list", "foo"], "list"),
+        (["foo"], None),
+        (["foo", "bar"], "foo bar"),
+        (["foo", "bar", "baz", "file"], "foo bar baz"),
+        (["foo", "bar", "file", "baz"], "foo bar"),
+        (["foo bar", "baz"], "foo bar baz"),
+        (["foo", "qux"], "foo qux"),
+        (["unknown", "list"], None),
+        ([], None),
+    ],
+)
+def test_longest_match(
+    index: CommandIndex, tokens: list[str], expected: str | None
+) -> None:
+    assert index.longest_match(tokens) == expected
+
+
+def test_namespaces(index: CommandIndex) -> None:
+    assert index.namespaces() == ["foo", "foo bar", "cache"]
+    assert index.has_namespace("foo")
+    assert index.has_namespace("foo bar")
+    assert not index.has_namespace("foo qux")
+    assert not index.has_namespace("debug")
+    assert not index.has_namespace("list")
+
+
+def test_namespaces_keep_the_order_commands_were_added() -> None:
+    index = CommandIndex()
+    index.add("x y")
+    index.add("a b", hidden=None)
+    index.add("x z w")
+    index.add("b", hidden=None)
+    index.add("c d")
+    index.add("b c", alias_of="b")
+
+    assert index.namespaces() == ["x", "x z", "b", "c"]
+
+    index.add("a b")
+    index.add("b", hidden=False)
+
+    assert index.namespaces() == ["x", "a", "x z", "b", "c"]
+
+    index.remove("x y")
+
+    assert index.namespaces() == ["a", "x", "x z", "b", "c"]
+
+
+def test_resolving_hidden_flag(index: CommandIndex) -> None:
+    assert index.unresolved() == ["debug info"]
+    assert index.unresolved("debug") == ["debug info"]
+    assert index.unresolved("debug info") == []
+    assert index.unresolved("foo") == []
+    assert index.unresolved("unknown") == []
+
+    index.add("debug info", hidden=False)
+
+    assert index.unresolved() == []
+    assert index.has_namespace("debug")
+
+
+def test_remove(index: CommandIndex) -> None:
+    index.remove("foo bar baz")
+    index.remove("unknown")
+
+    assert "foo bar baz" not in index
+    assert index.longest_match(["foo", "bar", "baz"]) == "foo bar"
+    assert index.namespaces() == ["foo", "cache"]
+
+    index.remove("foo bar")
+
+    assert index.longest_match(["foo", "bar"]) is None
+    assert index.namespaces() == ["cache"]
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import time
+
+from difflib import SequenceMatcher
+from typing import TYPE_CHECKING
+
 import pytest
 
+from cleo._utils import SimilarNameIndex
+from cleo._utils import display_width
 from cleo._utils import find_similar_names
 from cleo._utils import format_time
 from cleo._utils import strip_tags
 from cleo._utils import wcswidth
 from cleo._utils import wcwidth
+from cleo._utils import width_index
+from cleo._utils import wrap
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 @pytest.mark.parametrize(
@@ -42,6 +55,50 @@ def test_find_similar_names(name: str, expected: list[str]) -> None:
     assert find_similar_names(name, names) == expected
 
 
+def test_similar_name_index_is_reusable() -> None:
+    index = SimilarNameIndex(["foo bar", "foo baz", "foo bar"])
+
+    assert len(index) == 2
+    assert index.find("foo b") == ["foo bar", "foo baz"]
+    assert index.find("qux") == []
+
+    index.add("foo")
+
+    assert "foo" in index
+    assert index.find("fo") == ["foo bar", "foo baz", "foo"]
+
+
+def test_similar_name_index_matches_find_similar_names() -> None:
+    names = [
+        f"{ns} {cmd}{i}"
+        for ns in ("db", "env", "cache")
+        for cmd in ("add", "remove", "list")
+        for i in range(20)
+    ]
+    index = SimilarNameIndex(names)
+
+    for name in ("db ad", "env lst", "cache rem3", "ad", "list1", "cahce"):
+        expected = []
+        for actual_name in names:
+            if " " in name and " " not in actual_name:
+                continue
+
+            distance = SequenceMatcher(None, actual_name, name).ratio()
+            substring_index = actual_name.find(name)
+            if distance > 0.4 and (distance <= len(name) / 3 or substring_index != -1):
+                expected.append(
+                    (
+                        distance,
+                        substring_index if substring_index != -1 else float("inf"),
+                        actual_name,
+                    )
+                )
+
+        assert index.find(name) == [
+            actual_name for *_, actual_name in sorted(expected, key=lambda m: m[:2])
+        ]
+
+
 @pytest.mark.parametrize(
     "value, expected", (("<ab> cde</>", " cde"), ("<ab", "<ab"), ("cd>", "cd>"))
 )
@@ -82,3 +139,110 @@ def test_wcwidth(c: str, expected: int) -> None:
 )
 def test_wcswidth(s: str, expected: int) -> None:
     assert wcswidth(s) == expected
+
+
+@pytest.mark.parametrize(
+    ("s", "expected"),
+    [
+        ("", 0),
+        ("hello,\tworld!", 13),
+        ("שְבֻעָיים", 6),
+        ("日本語 text", 11),
+        ("\x1b🉐", 3),
+    ],
+)
+def test_display_width(s: str, expected: int) -> None:
+    assert display_width(s) == expected
+
+
+@pytest.mark.parametrize(
+    ("s", "width", "expected"),
+    [
+        ("hello", 3, 3),
+        ("hello", 10, 5),
+        ("日本語", 3, 1),
+        ("日本語", 4, 2),
+        ("e\u0301e\u0301", 1, 2),
+    ],
+)
+def test_width_index(s: str, width: int, expected: int) -> None:
+    assert width_index(s, width) == expected
+
+
+@pytest.mark.parametrize(
+    ("s", "width", "expected"),
+    [
+        ("hello world", 5, "hello\nworld\n"),
+        ("abcdef\nabc", 3, "abc\ndef\n\nabc\n"),
+        ("日本語のテキスト", 5, "日本\n語の\nテキ\nスト"),
+        ("ab日本", 3, "ab\n日\n本"),
+        ("日本 語", 4, "日本\n語"),
+        ("e\u0301e\u0301e\u0301", 2, "e\u0301e\u0301\ne\u0301"),
+    ],
+)
+def test_wrap(s: str, width: int, expected: str) -> None:
+    assert wrap(s, width) == expected
+
+
+def test_wrap_mixed_scripts() -> None:
+    text = "Lorem ipsum 日本語のテキスト שְבֻעָיים 🉐 " * 1000
+
+    lines = wrap(text, 20).split("\n")
+
+    assert "".join(lines).replace(" ", "") == text.replace(" ", "")
+    assert all(display_width(line) <= 20 for line in lines)
+
+
+MIXED_SCRIPTS = "Lorem ipsum 日本語のテキスト שְבֻעָיים 🉐 été "
+
+
+def _best_time(func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+@pytest.mark.parametrize("width", [1, 7, 20, 80])
+def test_wrap_large_mixed_scripts(width: int) -> None:
+    text = MIXED_SCRIPTS * 5000
+
+    lines = wrap(text, width).split("\n")
+
+    assert "".join(lines).replace(" ", "") == text.replace(" ", "")
+    assert all(display_width(line) <= max(width, 2) for line in lines)
+    assert sum(map(display_width, lines)) <= display_width(text)
+
+
+def test_width_index_large_mixed_scripts() -> None:
+    text = MIXED_SCRIPTS * 5000
+    total = display_width(text)
+
+    for width in (0, 1, 13, total // 3, total - 1, total, total + 1):
+        index = width_index(text, width)
+
+        assert display_width(text[:index]) <= width
+        assert index == len(text) or display_width(text[: index + 1]) > width
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda text: wrap(text, 20),
+        display_width,
+        lambda text: width_index(text, display_width(text) // 2),
+    ],
+)
+def test_mixed_scripts_scale_linearly(func: Callable[[str], object]) -> None:
+    small = MIXED_SCRIPTS * 2000
+    large = MIXED_SCRIPTS * 8000
+
+    small_time = _best_time(lambda: func(small))
+    large_time = _best_time(lambda: func(large))
+
+    # Four times the input: linear code takes about four times as long,
+    # quadratic code sixteen times.
+    assert large_time < 10 * small_time + 0.05
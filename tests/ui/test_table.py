@@ -428,6 +428,25 @@ def test_render(
     assert io.fetch_output() == expected
 
 
+def test_render_wide_characters(io: BufferedIO) -> None:
+    table = Table(io, style="box")
+    table.set_headers(["Name", "Description"])
+    table.set_rows([["日本語", "テキスト"], ["<info>abc</info>", "mixed 文字 text"]])
+
+    table.render()
+
+    expected = """\
+┌────────┬─────────────────┐
+│ Name   │ Description     │
+├────────┼─────────────────┤
+│ 日本語 │ テキスト        │
+│ abc    │ mixed 文字 text │
+└────────┴─────────────────┘
+"""
+
+    assert io.fetch_output() == expected
+
+
 def test_column_style(io: BufferedIO) -> None:
     table = Table(io)
     table.set_headers(["ISBN", "Title", "Author", "Price"])